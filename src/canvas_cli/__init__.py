@@ -2,30 +2,72 @@
 
 __version__ = "0.1.0"
 
-from .models import AuthContext
-from .tools import (
-    TOOL_REGISTRY,
-    canvas_get_conversation,
-    canvas_get_delta_bundle,
-    canvas_get_discussion_entries,
-    canvas_get_discussion_replies,
-    canvas_get_planner_items,
-    canvas_get_profile,
-    canvas_get_todo_items,
-    canvas_get_upcoming_events,
-    canvas_get_calendar_events,
-    canvas_list_announcements,
-    canvas_list_assignments,
-    canvas_list_assignment_groups,
-    canvas_list_conversations,
-    canvas_list_courses,
-    canvas_list_discussion_topics,
-    canvas_list_files,
-    canvas_list_module_items,
-    canvas_list_modules,
-    canvas_list_pages,
-    canvas_list_quizzes,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import AuthContext
+    from .tools import (
+        TOOL_REGISTRY,
+        canvas_get_conversation,
+        canvas_get_delta_bundle,
+        canvas_get_discussion_entries,
+        canvas_get_discussion_replies,
+        canvas_get_planner_items,
+        canvas_get_profile,
+        canvas_get_todo_items,
+        canvas_get_upcoming_events,
+        canvas_get_calendar_events,
+        canvas_list_announcements,
+        canvas_list_assignments,
+        canvas_list_assignment_groups,
+        canvas_list_conversations,
+        canvas_list_courses,
+        canvas_list_discussion_topics,
+        canvas_list_files,
+        canvas_list_module_items,
+        canvas_list_modules,
+        canvas_list_pages,
+        canvas_list_quizzes,
+    )
+
+# Public names are resolved lazily (PEP 562) so importing the package
+# doesn't pull in canvasapi and every tool module up front
+_LAZY_IMPORTS = {
+    "AuthContext": ".models",
+    "TOOL_REGISTRY": ".tools",
+    "canvas_get_conversation": ".tools",
+    "canvas_get_delta_bundle": ".tools",
+    "canvas_get_discussion_entries": ".tools",
+    "canvas_get_discussion_replies": ".tools",
+    "canvas_get_planner_items": ".tools",
+    "canvas_get_profile": ".tools",
+    "canvas_get_todo_items": ".tools",
+    "canvas_get_upcoming_events": ".tools",
+    "canvas_get_calendar_events": ".tools",
+    "canvas_list_announcements": ".tools",
+    "canvas_list_assignments": ".tools",
+    "canvas_list_assignment_groups": ".tools",
+    "canvas_list_conversations": ".tools",
+    "canvas_list_courses": ".tools",
+    "canvas_list_discussion_topics": ".tools",
+    "canvas_list_files": ".tools",
+    "canvas_list_module_items": ".tools",
+    "canvas_list_modules": ".tools",
+    "canvas_list_pages": ".tools",
+    "canvas_list_quizzes": ".tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AuthContext",
@@ -4,13 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from canvasapi import Canvas
-from canvasapi.exceptions import CanvasException
-
 from .models import AuthContext
 
 if TYPE_CHECKING:
-    pass
+    from canvasapi import Canvas
 
 
 class AuthError(Exception):
@@ -32,6 +29,9 @@ def get_canvas_client(auth: AuthContext) -> Canvas:
     Raises:
         AuthError: If the auth context is invalid
     """
+    # Deferred so importing this module doesn't load canvasapi
+    from canvasapi import Canvas
+
     if not auth.canvas_base_url:
         raise AuthError("Canvas base URL is required")
 
@@ -61,6 +61,8 @@ def validate_auth(auth: AuthContext) -> None:
     Raises:
         AuthError: If authentication fails
     """
+    from canvasapi.exceptions import CanvasException
+
     try:
         client = get_canvas_client(auth)
         # Make a simple API call to verify credentials
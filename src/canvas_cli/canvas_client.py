@@ -2,42 +2,95 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from itertools import islice
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from canvasapi import Canvas
-from canvasapi.paginated_list import PaginatedList
+import requests
 
 from .auth import get_canvas_client
 from .models import AuthContext
+from .utils.rate_limit import RateLimitedAdapter, RateLimiter
 
 if TYPE_CHECKING:
-    pass
+    from canvasapi import Canvas
+    from canvasapi.paginated_list import PaginatedList
 
 T = TypeVar("T")
 
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Items per Canvas API request; 100 is the maximum most endpoints allow,
+# so paginated lists need as few round-trips as possible
+CANVAS_PER_PAGE = 100
+
+# Upper bound on concurrent Canvas requests issued by one tool call
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of distinct credentials to keep clients around for
+CLIENT_CACHE_SIZE = 64
+
+# Least recently used first, keyed by (base URL, token)
+_client_cache: OrderedDict[tuple[str, str], CanvasClient] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
 
 class CanvasClient:
     """Wrapper around Canvas API client with utilities."""
 
+    # Many clients can be cached at once (one per credential pair)
+    __slots__ = ("_auth", "_client", "_session", "_base_url")
+
     def __init__(self, auth: AuthContext) -> None:
         """Initialize with auth context."""
         self._auth = auth
         self._client: Canvas | None = None
 
+        # Normalize the raw HTTP base URL once (must include /api/v1)
+        url = auth.canvas_base_url.rstrip("/")
+        self._base_url = url if url.endswith("/api/v1") else url + "/api/v1"
+        # Canvas rate limits are per token, so each client gets its own limiter
+        self._session = requests.Session()
+        adapter = RateLimitedAdapter(
+            RateLimiter(max_concurrent=MAX_CONCURRENT_REQUESTS),
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def __enter__(self) -> CanvasClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     @property
     def client(self) -> Canvas:
         """Get the Canvas client, creating if needed."""
         if self._client is None:
             self._client = get_canvas_client(self._auth)
+            # canvasapi builds its own requests.Session per Canvas object;
+            # swap in the pooled session so connections are kept alive.
+            self._client._Canvas__requester._session = self._session
         return self._client
 
+    @property
+    def session(self) -> requests.Session:
+        """Get the pooled HTTP session shared with the Canvas client."""
+        return self._session
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
     @property
     def base_url(self) -> str:
         """Get the base URL for raw HTTP requests (includes /api/v1)."""
-        url = self._auth.canvas_base_url.rstrip("/")
-        if not url.endswith("/api/v1"):
-            url = url + "/api/v1"
-        return url
+        return self._base_url
 
     @property
     def access_token(self) -> str:
@@ -52,6 +105,32 @@ class CanvasClient:
         """Get a specific course by ID."""
         return self.client.get_course(course_id)
 
+    def course_stub(self, course_id: int):
+        """
+        Build a Course holding only its ID, without fetching it.
+
+        Enough for calling list endpoints under /courses/:id when none of
+        the course's own fields are needed; saves the GET /courses/:id.
+        An invalid ID surfaces when the list endpoint is requested.
+        """
+        from canvasapi.course import Course
+
+        return Course(self.client._Canvas__requester, {"id": course_id})
+
+    def discussion_entry_stub(self, course_id: int, topic_id: int, entry_id: int):
+        """
+        Build a course DiscussionEntry holding only its IDs, without fetching it.
+
+        Like course_stub(), for calling list endpoints under the entry
+        (e.g. get_replies()) when the entry's own fields aren't needed.
+        """
+        from canvasapi.discussion_topic import DiscussionEntry
+
+        return DiscussionEntry(
+            self.client._Canvas__requester,
+            {"id": entry_id, "discussion_id": topic_id, "course_id": course_id},
+        )
+
     @staticmethod
     def extract_paginated_list(
         paginated: PaginatedList, page: int = 1, page_size: int = 100
@@ -67,31 +146,52 @@ class CanvasClient:
         Returns:
             Tuple of (items list, has_more boolean)
         """
-        items = []
+        items: list[Any] = []
         has_more = False
 
-        # PaginatedList doesn't have native pagination, so we iterate
-        # and collect items manually
+        # PaginatedList doesn't have native pagination, so we take a window
+        # of page_size + 1 items (the extra one tells us if there are more)
         try:
-            # Get all items up to the page we need plus one extra
-            # to check if there are more
             start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size + 1  # +1 to check for more
-
-            all_items = []
-            for i, item in enumerate(paginated):
-                all_items.append(item)
-                if i >= end_idx:
-                    break
+            window = list(islice(paginated, start_idx, start_idx + page_size + 1))
 
-            # Extract the page
-            items = all_items[start_idx:start_idx + page_size]
-
-            # Check if there are more items
-            has_more = len(all_items) > start_idx + page_size
+            items = window[:page_size]
+            has_more = len(window) > page_size
 
         except Exception:
             # If pagination fails, return empty
             pass
 
         return items, has_more
+
+
+def get_cached_client(auth: AuthContext) -> CanvasClient:
+    """
+    Get a shared CanvasClient for the given credentials.
+
+    Clients are memoized per (base URL, token) so repeated tool calls reuse
+    the same Canvas object and pooled HTTP session. At most
+    CLIENT_CACHE_SIZE clients are kept; the least recently used one is
+    closed when evicted so its pooled connections are released.
+
+    Args:
+        auth: Authentication context with base URL and access token
+
+    Returns:
+        CanvasClient instance
+    """
+    key = (auth.canvas_base_url, auth.canvas_access_token)
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache.move_to_end(key)
+            return client
+
+        client = CanvasClient(
+            AuthContext.model_construct(canvas_base_url=key[0], canvas_access_token=key[1])
+        )
+        _client_cache[key] = client
+        while len(_client_cache) > CLIENT_CACHE_SIZE:
+            _, evicted = _client_cache.popitem(last=False)
+            evicted.close()
+        return client
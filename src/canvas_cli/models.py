@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .utils.normalize_time import now_iso
 
 
 class AuthContext(BaseModel):
     """Authentication context for Canvas API."""
 
+    # Immutable and hashable so it can be shared and used as a cache key
+    model_config = ConfigDict(frozen=True)
+
     canvas_base_url: str = Field(
         ...,
         description="Canvas instance base URL (e.g., https://canvas.instructure.com/api/v1)",
@@ -56,9 +60,7 @@ class ToolOutput(BaseModel):
     tool: str
     items: list[dict[str, Any]] = Field(default_factory=list)
     pagination: PaginationInfo | None = None
-    fetched_at: str = Field(
-        default_factory=lambda: datetime.utcnow().isoformat() + "Z"
-    )
+    fetched_at: str = Field(default_factory=now_iso)
     errors: list[str] = Field(default_factory=list)
 
 
@@ -166,7 +168,9 @@ class ListModuleItemsInput(ModuleIdInput, PaginationParams):
 class ListPagesInput(CourseIdInput, PaginationParams):
     """Input for listing pages."""
 
-    pass
+    include_body: bool = Field(
+        default=False, description="Include each page's HTML body"
+    )
 
 
 class ListFilesInput(CourseIdInput, PaginationParams):
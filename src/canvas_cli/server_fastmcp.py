@@ -2,35 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
-from .tools import (
-    canvas_get_conversation,
-    canvas_get_delta_bundle,
-    canvas_get_discussion_entries,
-    canvas_get_discussion_replies,
-    canvas_get_profile,
-    canvas_get_todo_items,
-    canvas_get_upcoming_events,
-    canvas_get_calendar_events,
-    canvas_get_planner_items,
-    canvas_list_announcements,
-    canvas_list_assignment_groups,
-    canvas_list_assignments,
-    canvas_list_conversations,
-    canvas_list_courses,
-    canvas_list_discussion_topics,
-    canvas_list_files,
-    canvas_list_module_items,
-    canvas_list_modules,
-    canvas_list_pages,
-    canvas_list_quizzes,
-)
+from .tools import TOOL_FUNCTIONS
+from .utils.coalesce import coalesce
 
 # Load environment variables
 load_dotenv()
@@ -54,33 +33,16 @@ mcp = FastMCP(
     """,
 )
 
-# Register all tools directly
-# Each tool function handles auth resolution internally
-mcp.tool(canvas_get_profile)
-mcp.tool(canvas_list_courses)
-mcp.tool(canvas_get_todo_items)
-mcp.tool(canvas_get_upcoming_events)
-mcp.tool(canvas_get_calendar_events)
-mcp.tool(canvas_get_planner_items)
-mcp.tool(canvas_list_assignments)
-mcp.tool(canvas_list_quizzes)
-mcp.tool(canvas_list_assignment_groups)
-mcp.tool(canvas_list_discussion_topics)
-mcp.tool(canvas_get_discussion_entries)
-mcp.tool(canvas_get_discussion_replies)
-mcp.tool(canvas_list_conversations)
-mcp.tool(canvas_get_conversation)
-mcp.tool(canvas_list_announcements)
-mcp.tool(canvas_list_modules)
-mcp.tool(canvas_list_module_items)
-mcp.tool(canvas_list_pages)
-mcp.tool(canvas_list_files)
-mcp.tool(canvas_get_delta_bundle)
+# Register all tools from the registry in one pass
+# Each tool function handles auth resolution internally; identical
+# concurrent calls are coalesced into a single Canvas round-trip
+for _func in TOOL_FUNCTIONS.values():
+    mcp.tool(coalesce(_func))
 
 
 def run():
     """Run the FastMCP server."""
-    logger.info("Starting Canvas CLI FastMCP server with 20 tools")
+    logger.info("Starting Canvas CLI FastMCP server with %d tools", len(TOOL_FUNCTIONS))
 
     # Check for environment credentials
     canvas_url = os.getenv("CANVAS_API_URL")
@@ -94,7 +56,7 @@ def run():
     port = int(os.getenv("PORT", "8000"))
 
     if os.getenv("PORT"):
-        logger.info(f"Running streamable-http on {host}:{port}")
+        logger.info("Running streamable-http on %s:%s", host, port)
         mcp.run(transport="streamable-http", host=host, port=port)
     else:
         logger.info("Running stdio for local development")
@@ -1,37 +1,47 @@
 """Canvas CLI tools package."""
 
-from .announcements import canvas_list_announcements
-from .auth import resolve_auth
-from .assignments import (
-    canvas_list_assignments,
-    canvas_list_assignment_groups,
-    canvas_list_quizzes,
-)
-from .bundle import canvas_get_delta_bundle
-from .conversations import canvas_get_conversation, canvas_list_conversations
-from .courses import canvas_list_courses
-from .discussions import (
-    canvas_get_discussion_entries,
-    canvas_get_discussion_replies,
-    canvas_list_discussion_topics,
-)
-from .profile import canvas_get_profile
-from .schedule import (
-    canvas_get_calendar_events,
-    canvas_get_planner_items,
-    canvas_get_todo_items,
-    canvas_get_upcoming_events,
-)
-from .structure import (
-    canvas_list_files,
-    canvas_list_module_items,
-    canvas_list_modules,
-    canvas_list_pages,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .announcements import canvas_list_announcements
+    from .auth import get_auth_from_env, resolve_auth
+    from .assignments import (
+        canvas_list_assignments,
+        canvas_list_assignment_groups,
+        canvas_list_quizzes,
+    )
+    from .bundle import canvas_get_delta_bundle
+    from .conversations import canvas_get_conversation, canvas_list_conversations
+    from .courses import canvas_list_courses
+    from .discussions import (
+        canvas_get_discussion_entries,
+        canvas_get_discussion_replies,
+        canvas_list_discussion_topics,
+    )
+    from .profile import canvas_get_profile
+    from .schedule import (
+        canvas_get_calendar_events,
+        canvas_get_planner_items,
+        canvas_get_todo_items,
+        canvas_get_upcoming_events,
+    )
+    from .structure import (
+        canvas_list_files,
+        canvas_list_module_items,
+        canvas_list_modules,
+        canvas_list_pages,
+    )
+    from .registry import (
+        TOOL_REGISTRY,
+        TOOL_FUNCTIONS,
+        TOOL_SCHEMAS,
+    )
 
 __all__ = [
     # Auth
     "resolve_auth",
+    "get_auth_from_env",
     # Profile
     "canvas_get_profile",
     # Courses
@@ -63,308 +73,42 @@ __all__ = [
     "canvas_get_delta_bundle",
 ]
 
-# Tool registry for MCP server (legacy - FastMCP generates schemas from function signatures)
-TOOL_REGISTRY = {
-    "canvas_get_profile": {
-        "function": canvas_get_profile,
-        "description": "Get the current user's Canvas profile.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {
-                    "type": "object",
-                    "description": "Optional auth dict with canvas_base_url and canvas_access_token (uses env vars if not provided)",
-                },
-            },
-            "required": [],
-        },
-    },
-    "canvas_list_courses": {
-        "function": canvas_list_courses,
-        "description": "List courses for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "enrollment_state": {"type": "string", "description": "Filter by enrollment state"},
-                "since": {"type": "string", "description": "ISO timestamp for delta fetch"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_get_todo_items": {
-        "function": canvas_get_todo_items,
-        "description": "Get todo items for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_get_upcoming_events": {
-        "function": canvas_get_upcoming_events,
-        "description": "Get upcoming events for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_get_calendar_events": {
-        "function": canvas_get_calendar_events,
-        "description": "Get calendar events for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "start_date": {"type": "string"},
-                "end_date": {"type": "string"},
-                "context_codes": {"type": "array", "items": {"type": "string"}},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_get_planner_items": {
-        "function": canvas_get_planner_items,
-        "description": "Get planner items for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "start_date": {"type": "string"},
-                "end_date": {"type": "string"},
-                "context_codes": {"type": "array", "items": {"type": "string"}},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_list_assignments": {
-        "function": canvas_list_assignments,
-        "description": "List assignments for a course. Use include_submissions=True to get submission data (grade, score, submitted_at).",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "include_submissions": {"type": "boolean", "default": False},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_list_quizzes": {
-        "function": canvas_list_quizzes,
-        "description": "List quizzes for a course. Falls back to extracting quizzes from modules if direct API is disabled.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_list_assignment_groups": {
-        "function": canvas_list_assignment_groups,
-        "description": "List assignment groups with weights for a course. Shows how much each category contributes to the final grade.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_list_discussion_topics": {
-        "function": canvas_list_discussion_topics,
-        "description": "List discussion topics for a course.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "only_announcements": {"type": "boolean", "default": False},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_get_discussion_entries": {
-        "function": canvas_get_discussion_entries,
-        "description": "Get entries for a discussion topic.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "topic_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id", "topic_id"],
-        },
-    },
-    "canvas_get_discussion_replies": {
-        "function": canvas_get_discussion_replies,
-        "description": "Get replies for a discussion entry.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "topic_id": {"type": "integer"},
-                "entry_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id", "topic_id", "entry_id"],
-        },
-    },
-    "canvas_list_conversations": {
-        "function": canvas_list_conversations,
-        "description": "List conversations (inbox) for the current user.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "scope": {"type": "string"},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_get_conversation": {
-        "function": canvas_get_conversation,
-        "description": "Get a single conversation with messages.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "conversation_id": {"type": "integer"},
-                "since": {"type": "string"},
-            },
-            "required": ["conversation_id"],
-        },
-    },
-    "canvas_list_announcements": {
-        "function": canvas_list_announcements,
-        "description": "List announcements for courses.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_ids": {"type": "array", "items": {"type": "integer"}},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "start_date": {"type": "string"},
-                "end_date": {"type": "string"},
-                "since": {"type": "string"},
-            },
-            "required": [],
-        },
-    },
-    "canvas_list_modules": {
-        "function": canvas_list_modules,
-        "description": "List modules for a course.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_list_module_items": {
-        "function": canvas_list_module_items,
-        "description": "List items in a module.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "module_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id", "module_id"],
-        },
-    },
-    "canvas_list_pages": {
-        "function": canvas_list_pages,
-        "description": "List pages for a course. Falls back to extracting pages from modules if direct API is disabled.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_list_files": {
-        "function": canvas_list_files,
-        "description": "List files for a course.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_id": {"type": "integer"},
-                "page": {"type": "integer", "default": 1},
-                "page_size": {"type": "integer", "default": 100},
-                "since": {"type": "string"},
-            },
-            "required": ["course_id"],
-        },
-    },
-    "canvas_get_delta_bundle": {
-        "function": canvas_get_delta_bundle,
-        "description": "Get a comprehensive bundle of Canvas data for syncing. Aggregates profile, courses, schedule items, and course-specific data.",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "auth": {"type": "object", "description": "Optional auth (uses env vars if not provided)"},
-                "course_ids": {"type": "array", "items": {"type": "integer"}},
-                "since": {"type": "string", "description": "ISO timestamp for delta fetch"},
-            },
-            "required": [],
-        },
-    },
+# Tool modules are imported on first access (PEP 562), so importing one
+# tool module doesn't load every other one (and canvasapi) with it
+_LAZY_IMPORTS = {
+    "canvas_list_announcements": ".announcements",
+    "get_auth_from_env": ".auth",
+    "resolve_auth": ".auth",
+    "canvas_list_assignments": ".assignments",
+    "canvas_list_assignment_groups": ".assignments",
+    "canvas_list_quizzes": ".assignments",
+    "canvas_get_delta_bundle": ".bundle",
+    "canvas_get_conversation": ".conversations",
+    "canvas_list_conversations": ".conversations",
+    "canvas_list_courses": ".courses",
+    "canvas_get_discussion_entries": ".discussions",
+    "canvas_get_discussion_replies": ".discussions",
+    "canvas_list_discussion_topics": ".discussions",
+    "canvas_get_profile": ".profile",
+    "canvas_get_calendar_events": ".schedule",
+    "canvas_get_planner_items": ".schedule",
+    "canvas_get_todo_items": ".schedule",
+    "canvas_get_upcoming_events": ".schedule",
+    "canvas_list_files": ".structure",
+    "canvas_list_module_items": ".structure",
+    "canvas_list_modules": ".structure",
+    "canvas_list_pages": ".structure",
+    "TOOL_REGISTRY": ".registry",
+    "TOOL_FUNCTIONS": ".registry",
+    "TOOL_SCHEMAS": ".registry",
 }
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,46 +1,92 @@
 """Announcements tool - canvas_list_announcements."""
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
-from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output
+from ..canvas_client import (
+    CANVAS_PER_PAGE,
+    MAX_CONCURRENT_REQUESTS,
+    CanvasClient,
+    get_cached_client,
+)
+from ..utils.course_cache import get_active_course_ids
+from ..utils.normalize_time import filter_since, normalize_canvas_time
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
 
 
+# Fields read from an announcement payload
+ANNOUNCEMENT_FIELDS = (
+    "id",
+    "title",
+    "message",
+    "course_id",
+    "posted_at",
+    "created_at",
+    "updated_at",
+    "url",
+    "html_url",
+    "author",
+    "read_state",
+    "unread_count",
+    "discussion_subentry_count",
+    "delayed_post_at",
+    "published",
+    "locked",
+)
+
+
 def serialize_announcement(announcement: Any) -> Dict[str, Any]:
-    """Serialize a Canvas Announcement to dict."""
-    author = getattr(announcement, "author", {}) or {}
+    """Serialize a Canvas Announcement (object or raw JSON dict) to dict."""
+    data = raw_fields(announcement, ANNOUNCEMENT_FIELDS)
+    get = data.get
+    author = get("author") or {}
+    if not isinstance(author, dict):
+        author = {}
     return {
-        "id": getattr(announcement, "id", None),
-        "title": getattr(announcement, "title", None),
-        "message": getattr(announcement, "message", None),
-        "course_id": getattr(announcement, "course_id", None),
-        "posted_at": normalize_canvas_time(getattr(announcement, "posted_at", None)),
-        "created_at": normalize_canvas_time(getattr(announcement, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(announcement, "updated_at", None)),
-        "url": getattr(announcement, "url", None),
-        "html_url": getattr(announcement, "html_url", None),
+        "id": get("id"),
+        "title": get("title"),
+        "message": get("message"),
+        "course_id": get("course_id"),
+        "posted_at": normalize_canvas_time(get("posted_at")),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "url": get("url"),
+        "html_url": get("html_url"),
         "author": {
-            "id": author.get("id") if isinstance(author, dict) else None,
-            "display_name": author.get("display_name") if isinstance(author, dict) else None,
-            "avatar_image_url": author.get("avatar_image_url")
-            if isinstance(author, dict)
-            else None,
+            "id": author.get("id"),
+            "display_name": author.get("display_name"),
+            "avatar_image_url": author.get("avatar_image_url"),
         },
-        "read_state": getattr(announcement, "read_state", None),
-        "unread_count": getattr(announcement, "unread_count", 0),
-        "discussion_subentry_count": getattr(announcement, "discussion_subentry_count", 0),
-        "delayed_post_at": normalize_canvas_time(
-            getattr(announcement, "delayed_post_at", None)
-        ),
-        "published": getattr(announcement, "published", None),
-        "locked": getattr(announcement, "locked", None),
+        "read_state": get("read_state"),
+        "unread_count": get("unread_count", 0),
+        "discussion_subentry_count": get("discussion_subentry_count", 0),
+        "delayed_post_at": normalize_canvas_time(get("delayed_post_at")),
+        "published": get("published"),
+        "locked": get("locked"),
     }
 
 
+def _posted_at_key(announcement: Any) -> str:
+    """Sort key for announcements by posted_at (missing sorts last)."""
+    return getattr(announcement, "posted_at", None) or ""
+
+
+def _fetch_course_announcements(
+    client: CanvasClient, course_id: int, kwargs: Dict[str, Any]
+) -> List[Any]:
+    """Fetch all announcements for a single course."""
+    course = client.course_stub(course_id)
+    paginated = course.get_discussion_topics(
+        only_announcements=True, per_page=CANVAS_PER_PAGE, **kwargs
+    )
+    return list(paginated)
+
+
 def canvas_list_announcements(
     auth: Optional[Dict[str, Any]] = None,
     *,
@@ -70,54 +116,57 @@ def canvas_list_announcements(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        canvas = client.client
+        client = get_cached_client(auth_ctx)
 
         # If no course_ids specified, get all active courses first
         if not course_ids:
-            user = client.get_current_user()
-            courses = list(user.get_courses(enrollment_state=["active"]))
-            course_ids = [c.id for c in courses]
+            course_ids = get_active_course_ids(client)
+
+        kwargs: Dict[str, Any] = {}
+        if start_date:
+            kwargs["start_date"] = start_date
+        if end_date:
+            kwargs["end_date"] = end_date
 
         all_announcements: List[Any] = []
 
-        # Fetch announcements for each course
-        for course_id in course_ids:
-            try:
-                course = client.get_course(course_id)
-                kwargs: Dict[str, Any] = {}
-                if start_date:
-                    kwargs["start_date"] = start_date
-                if end_date:
-                    kwargs["end_date"] = end_date
-
-                paginated = course.get_discussion_topics(only_announcements=True, **kwargs)
-                announcements = list(paginated)
-                all_announcements.extend(announcements)
-            except CanvasException as e:
-                errors.append(f"Error fetching announcements for course {course_id}: {e}")
-                continue
-
-        # Sort by posted_at descending
-        all_announcements.sort(
-            key=lambda a: getattr(a, "posted_at", None) or "",
-            reverse=True,
-        )
+        # Fetch announcements for all courses concurrently, then merge in
+        # course order so errors and results stay deterministic
+        max_workers = max(1, min(len(course_ids), MAX_CONCURRENT_REQUESTS))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_fetch_course_announcements, client, course_id, kwargs)
+                for course_id in course_ids
+            ]
+            for course_id, future in zip(course_ids, futures):
+                try:
+                    all_announcements.extend(future.result())
+                except CanvasException as e:
+                    errors.append(f"Error fetching announcements for course {course_id}: {e}")
 
         # Filter by since if provided
         if since:
-            from ..utils.normalize_time import is_after
-
-            all_announcements = [
-                a
-                for a in all_announcements
-                if is_after(getattr(a, "updated_at", None), since)
-            ]
+            all_announcements = filter_since(all_announcements, since)
 
-        # Apply pagination
+        # Apply pagination: only the first end_idx items by posted_at
+        # (descending) are needed, so select them with a heap instead of
+        # sorting everything
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
-        sliced = all_announcements[start_idx:end_idx]
+
+        # Nothing on this page (including no announcements at all)
+        if start_idx >= len(all_announcements):
+            return build_tool_output(
+                tool="canvas_list_announcements",
+                items=[],
+                page=page,
+                page_size=page_size,
+                has_more=False,
+                errors=errors,
+            )
+
+        top = heapq.nlargest(end_idx, all_announcements, key=_posted_at_key)
+        sliced = top[start_idx:end_idx]
         has_more = len(all_announcements) > end_idx
 
         serialized = [serialize_announcement(a) for a in sliced]
@@ -133,21 +182,11 @@ def canvas_list_announcements(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_announcements",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_announcements", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_announcements",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_announcements", page=page, page_size=page_size, errors=errors
         )
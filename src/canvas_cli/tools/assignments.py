@@ -1,42 +1,109 @@
 """Assignments tools - assignments, quizzes, submissions."""
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
-from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output
+from ..canvas_client import (
+    CANVAS_PER_PAGE,
+    MAX_CONCURRENT_REQUESTS,
+    CanvasClient,
+    get_cached_client,
+)
+from ..utils.normalize_time import filter_since, normalize_canvas_time
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields, truncate_text
 from .auth import resolve_auth
+from .listing import run_list_tool
+
+
+# Fields read from an assignment payload
+ASSIGNMENT_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "course_id",
+    "points_possible",
+    "due_at",
+    "lock_at",
+    "unlock_at",
+    "workflow_state",
+    "assignment_group_id",
+    "grading_type",
+    "submission_types",
+    "has_submitted_submissions",
+    "has_overrides",
+    "html_url",
+    "created_at",
+    "updated_at",
+    "published",
+    "unpublishable",
+    "submission",
+)
+
+# Fields read from a quiz payload
+QUIZ_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "quiz_type",
+    "course_id",
+    "points_possible",
+    "due_at",
+    "lock_at",
+    "unlock_at",
+    "time_limit",
+    "shuffle_answers",
+    "show_correct_answers",
+    "show_correct_answers_at",
+    "hide_correct_answers_at",
+    "allowed_attempts",
+    "scoring_policy",
+    "question_count",
+    "html_url",
+    "mobile_url",
+    "published",
+    "unpublishable",
+    "locked_for_user",
+    "created_at",
+    "updated_at",
+)
+
+
+def serialize_assignment(
+    assignment: Any, description_max_chars: Optional[int] = None
+) -> Dict[str, Any]:
+    """Serialize a Canvas Assignment (object or raw JSON dict) to dict.
 
-
-def serialize_assignment(assignment: Any) -> Dict[str, Any]:
-    """Serialize a Canvas Assignment to dict."""
+    description_max_chars caps the HTML description; None keeps it whole.
+    """
+    get = raw_fields(assignment, ASSIGNMENT_FIELDS).get
     result = {
-        "id": getattr(assignment, "id", None),
-        "name": getattr(assignment, "name", None),
-        "description": getattr(assignment, "description", None),
-        "course_id": getattr(assignment, "course_id", None),
-        "points_possible": getattr(assignment, "points_possible", None),
-        "due_at": normalize_canvas_time(getattr(assignment, "due_at", None)),
-        "lock_at": normalize_canvas_time(getattr(assignment, "lock_at", None)),
-        "unlock_at": normalize_canvas_time(getattr(assignment, "unlock_at", None)),
-        "workflow_state": getattr(assignment, "workflow_state", None),
-        "assignment_group_id": getattr(assignment, "assignment_group_id", None),
-        "grading_type": getattr(assignment, "grading_type", None),
-        "submission_types": getattr(assignment, "submission_types", []),
-        "has_submitted_submissions": getattr(assignment, "has_submitted_submissions", False),
-        "has_overrides": getattr(assignment, "has_overrides", False),
-        "html_url": getattr(assignment, "html_url", None),
-        "created_at": normalize_canvas_time(getattr(assignment, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(assignment, "updated_at", None)),
-        "published": getattr(assignment, "published", None),
-        "unpublishable": getattr(assignment, "unpublishable", None),
+        "id": get("id"),
+        "name": get("name"),
+        "description": truncate_text(get("description"), description_max_chars),
+        "course_id": get("course_id"),
+        "points_possible": get("points_possible"),
+        "due_at": normalize_canvas_time(get("due_at")),
+        "lock_at": normalize_canvas_time(get("lock_at")),
+        "unlock_at": normalize_canvas_time(get("unlock_at")),
+        "workflow_state": get("workflow_state"),
+        "assignment_group_id": get("assignment_group_id"),
+        "grading_type": get("grading_type"),
+        "submission_types": get("submission_types", []),
+        "has_submitted_submissions": get("has_submitted_submissions", False),
+        "has_overrides": get("has_overrides", False),
+        "html_url": get("html_url"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "published": get("published"),
+        "unpublishable": get("unpublishable"),
     }
 
     # Include submission data if available
     # Note: submission can be a dict (from include=['submission']) or an object
-    submission = getattr(assignment, "submission", None)
+    submission = get("submission")
     if submission:
         if isinstance(submission, dict):
             # Handle dict format (from include=['submission'])
@@ -64,40 +131,87 @@ def serialize_assignment(assignment: Any) -> Dict[str, Any]:
     return result
 
 
-def serialize_quiz(quiz: Any) -> Dict[str, Any]:
-    """Serialize a Canvas Quiz to dict."""
+def serialize_quiz(quiz: Any, description_max_chars: Optional[int] = None) -> Dict[str, Any]:
+    """Serialize a Canvas Quiz (object or raw JSON dict) to dict.
+
+    description_max_chars caps the HTML description; None keeps it whole.
+    """
+    get = raw_fields(quiz, QUIZ_FIELDS).get
     return {
-        "id": getattr(quiz, "id", None),
-        "title": getattr(quiz, "title", None),
-        "description": getattr(quiz, "description", None),
-        "quiz_type": getattr(quiz, "quiz_type", None),
-        "course_id": getattr(quiz, "course_id", None),
-        "points_possible": getattr(quiz, "points_possible", None),
-        "due_at": normalize_canvas_time(getattr(quiz, "due_at", None)),
-        "lock_at": normalize_canvas_time(getattr(quiz, "lock_at", None)),
-        "unlock_at": normalize_canvas_time(getattr(quiz, "unlock_at", None)),
-        "time_limit": getattr(quiz, "time_limit", None),
-        "shuffle_answers": getattr(quiz, "shuffle_answers", None),
-        "show_correct_answers": getattr(quiz, "show_correct_answers", None),
-        "show_correct_answers_at": normalize_canvas_time(
-            getattr(quiz, "show_correct_answers_at", None)
-        ),
-        "hide_correct_answers_at": normalize_canvas_time(
-            getattr(quiz, "hide_correct_answers_at", None)
-        ),
-        "allowed_attempts": getattr(quiz, "allowed_attempts", None),
-        "scoring_policy": getattr(quiz, "scoring_policy", None),
-        "question_count": getattr(quiz, "question_count", None),
-        "html_url": getattr(quiz, "html_url", None),
-        "mobile_url": getattr(quiz, "mobile_url", None),
-        "published": getattr(quiz, "published", None),
-        "unpublishable": getattr(quiz, "unpublishable", None),
-        "locked_for_user": getattr(quiz, "locked_for_user", None),
-        "created_at": normalize_canvas_time(getattr(quiz, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(quiz, "updated_at", None)),
+        "id": get("id"),
+        "title": get("title"),
+        "description": truncate_text(get("description"), description_max_chars),
+        "quiz_type": get("quiz_type"),
+        "course_id": get("course_id"),
+        "points_possible": get("points_possible"),
+        "due_at": normalize_canvas_time(get("due_at")),
+        "lock_at": normalize_canvas_time(get("lock_at")),
+        "unlock_at": normalize_canvas_time(get("unlock_at")),
+        "time_limit": get("time_limit"),
+        "shuffle_answers": get("shuffle_answers"),
+        "show_correct_answers": get("show_correct_answers"),
+        "show_correct_answers_at": normalize_canvas_time(get("show_correct_answers_at")),
+        "hide_correct_answers_at": normalize_canvas_time(get("hide_correct_answers_at")),
+        "allowed_attempts": get("allowed_attempts"),
+        "scoring_policy": get("scoring_policy"),
+        "question_count": get("question_count"),
+        "html_url": get("html_url"),
+        "mobile_url": get("mobile_url"),
+        "published": get("published"),
+        "unpublishable": get("unpublishable"),
+        "locked_for_user": get("locked_for_user"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
+def _module_quiz_refs(course: Any, limit: Optional[int] = None) -> List[Tuple[int, Any]]:
+    """Collect (quiz_id, title) for Quiz items in a course's modules.
+
+    Modules are read lazily; with a limit, scanning stops once that many
+    quizzes are found, so later module pages are never requested.
+    """
+    quiz_refs: List[Tuple[int, Any]] = []
+    for module in course.get_modules(per_page=CANVAS_PER_PAGE):
+        if limit is not None and len(quiz_refs) >= limit:
+            break
+        try:
+            module_items = list(module.get_module_items(per_page=CANVAS_PER_PAGE))
+        except Exception:
+            continue
+        for item in module_items:
+            if getattr(item, 'type', None) == 'Quiz':
+                quiz_id = getattr(item, 'content_id', None)
+                if quiz_id:
+                    quiz_refs.append((quiz_id, getattr(item, 'title', None)))
+    return quiz_refs
+
+
+def _fetch_module_quizzes(
+    course: Any,
+    course_id: int,
+    quiz_refs: List[Tuple[int, Any]],
+    description_max_chars: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Fetch and serialize quizzes concurrently, keeping quiz_refs order.
+
+    A quiz that can't be fetched is reported with just its id and title.
+    """
+
+    def fetch(ref: Tuple[int, Any]) -> Dict[str, Any]:
+        quiz_id, title = ref
+        try:
+            return serialize_quiz(course.get_quiz(quiz_id), description_max_chars)
+        except Exception:
+            return {"id": quiz_id, "title": title, "course_id": course_id}
+
+    if not quiz_refs:
+        return []
+    max_workers = min(len(quiz_refs), MAX_CONCURRENT_REQUESTS)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fetch, quiz_refs))
+
+
 def canvas_list_assignments(
     auth: Optional[Dict[str, Any]] = None,
     *,
@@ -106,6 +220,7 @@ def canvas_list_assignments(
     page_size: int = 100,
     include_submissions: bool = False,
     since: Optional[str] = None,
+    description_max_chars: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     List assignments for a course.
@@ -117,65 +232,26 @@ def canvas_list_assignments(
         page_size: Items per page
         include_submissions: Include submission data
         since: ISO timestamp for delta fetch
+        description_max_chars: Truncate descriptions to this many characters
 
     Returns:
         Tool output with assignments
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
-
-        kwargs: Dict[str, Any] = {}
-        if include_submissions:
-            kwargs["include"] = ["submission"]
-
-        paginated = course.get_assignments(**kwargs)
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        assignments = [serialize_assignment(assignment) for assignment in items]
-
-        return build_tool_output(
-            tool="canvas_list_assignments",
-            items=assignments,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_assignments",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_assignments",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    kwargs: Dict[str, Any] = {}
+    if include_submissions:
+        kwargs["include"] = ["submission"]
+
+    return run_list_tool(
+        "canvas_list_assignments",
+        auth,
+        lambda client: client.get_course(course_id).get_assignments(
+            per_page=CANVAS_PER_PAGE, **kwargs
+        ),
+        lambda assignment: serialize_assignment(assignment, description_max_chars),
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
 
 
 def canvas_list_quizzes(
@@ -185,6 +261,7 @@ def canvas_list_quizzes(
     page: int = 1,
     page_size: int = 100,
     since: Optional[str] = None,
+    description_max_chars: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     List quizzes for a course.
@@ -199,6 +276,7 @@ def canvas_list_quizzes(
         page: Page number
         page_size: Items per page
         since: ISO timestamp for delta fetch
+        description_max_chars: Truncate descriptions to this many characters
 
     Returns:
         Tool output with quizzes
@@ -207,55 +285,64 @@ def canvas_list_quizzes(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         course = client.get_course(course_id)
 
-        all_quizzes = []
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        quizzes: List[Any] = []
 
         # Try direct API first
         try:
-            paginated = course.get_quizzes()
-            items, _ = CanvasClient.extract_paginated_list(paginated, 1, 1000)
-            all_quizzes = [serialize_quiz(q) for q in items]
+            paginated = course.get_quizzes(per_page=CANVAS_PER_PAGE)
+            quizzes, _ = CanvasClient.extract_paginated_list(paginated, 1, 1000)
         except Exception:
             # Direct API failed, use fallback
             errors.append("Direct quizzes API unavailable, using module fallback")
 
-        # Fallback: Extract quizzes from modules if direct API failed
-        if not all_quizzes:
-            modules = list(course.get_modules())
-
-            for module in modules:
-                try:
-                    module_items = list(module.get_module_items())
-                    for item in module_items:
-                        if getattr(item, 'type', None) == 'Quiz':
-                            quiz_id = getattr(item, 'content_id', None)
-                            if quiz_id:
-                                try:
-                                    q = course.get_quiz(quiz_id)
-                                    all_quizzes.append(serialize_quiz(q))
-                                except Exception:
-                                    all_quizzes.append({
-                                        "id": quiz_id,
-                                        "title": getattr(item, 'title', None),
-                                        "course_id": course_id,
-                                    })
-                except Exception:
-                    continue
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            all_quizzes = [
-                q for q in all_quizzes
-                if is_after(q.get("updated_at"), since)
-            ]
+        if quizzes:
+            # Without a since filter, only the requested page is serialized
+            if not since:
+                return build_tool_output(
+                    tool="canvas_list_quizzes",
+                    items=[
+                        serialize_quiz(q, description_max_chars)
+                        for q in quizzes[start_idx:end_idx]
+                    ],
+                    page=page,
+                    page_size=page_size,
+                    has_more=len(quizzes) > end_idx,
+                    errors=errors,
+                )
+            all_quizzes = [serialize_quiz(q, description_max_chars) for q in quizzes]
+
+        else:
+            # Fallback: Extract quizzes from modules if direct API failed
+            # Without a since filter, only the requested page needs its
+            # quizzes fetched; one quiz past it is enough to set has_more
+            if not since:
+                quiz_refs = _module_quiz_refs(course, limit=end_idx + 1)
+                return build_tool_output(
+                    tool="canvas_list_quizzes",
+                    items=_fetch_module_quizzes(
+                        course, course_id, quiz_refs[start_idx:end_idx], description_max_chars
+                    ),
+                    page=page,
+                    page_size=page_size,
+                    has_more=len(quiz_refs) > end_idx,
+                    errors=errors,
+                )
+
+            all_quizzes = _fetch_module_quizzes(
+                course, course_id, _module_quiz_refs(course), description_max_chars
+            )
+
+        # Only reached with a since filter, which needs every quiz's
+        # updated_at before paginating (nothing to do on an empty list)
+        if all_quizzes:
+            all_quizzes = filter_since(all_quizzes, since)
 
         # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
         paginated_quizzes = all_quizzes[start_idx:end_idx]
         has_more = len(all_quizzes) > end_idx
 
@@ -270,23 +357,13 @@ def canvas_list_quizzes(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_quizzes",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_quizzes", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_quizzes",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_quizzes", page=page, page_size=page_size, errors=errors
         )
 
 
@@ -316,10 +393,10 @@ def canvas_list_assignment_groups(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         course = client.get_course(course_id)
 
-        groups = list(course.get_assignment_groups())
+        groups = list(course.get_assignment_groups(per_page=CANVAS_PER_PAGE))
 
         items = []
         total_weight = 0
@@ -1,11 +1,43 @@
 """Auth resolution utilities for Canvas CLI tools."""
 
+import functools
 import os
-from typing import Union
+from typing import Optional, Union
 
 from ..models import AuthContext
 
 
+@functools.cache
+def get_auth_from_env() -> Optional[AuthContext]:
+    """Build an AuthContext from CANVAS_API_URL/CANVAS_API_KEY (cached).
+
+    Environment variables don't change within a process, so this is
+    computed once. Call ``get_auth_from_env.cache_clear()`` after changing
+    them (e.g. in tests).
+
+    Returns:
+        AuthContext from the environment, or None if either variable is unset
+    """
+    url = os.getenv("CANVAS_API_URL")
+    token = os.getenv("CANVAS_API_KEY")
+    if not url or not token:
+        return None
+    # Both values are non-empty strings from the environment, so the
+    # pydantic validation pass can be skipped. Client-supplied dicts in
+    # resolve_auth still go through full validation.
+    return AuthContext.model_construct(canvas_base_url=url, canvas_access_token=token)
+
+
+@functools.lru_cache(maxsize=32)
+def _auth_from_pair(base_url: Optional[str], token: Optional[str]) -> AuthContext:
+    """Build a validated AuthContext for a credential pair (cached).
+
+    AuthContext is frozen, so one instance can be shared by every call
+    that sends the same credentials. Invalid pairs raise and aren't cached.
+    """
+    return AuthContext(canvas_base_url=base_url, canvas_access_token=token)
+
+
 def resolve_auth(auth: Union[dict, AuthContext, None]) -> AuthContext:
     """Resolve auth from dict, AuthContext, or environment variables.
 
@@ -24,16 +56,15 @@ def resolve_auth(auth: Union[dict, AuthContext, None]) -> AuthContext:
         return auth
 
     if auth:
-        return AuthContext(
-            canvas_base_url=auth.get("canvas_base_url") or auth.get("canvasApiUrl"),
-            canvas_access_token=auth.get("canvas_access_token") or auth.get("canvasApiKey"),
+        return _auth_from_pair(
+            auth.get("canvas_base_url") or auth.get("canvasApiUrl"),
+            auth.get("canvas_access_token") or auth.get("canvasApiKey"),
         )
     # Fallback to environment variables
-    url = os.getenv("CANVAS_API_URL")
-    token = os.getenv("CANVAS_API_KEY")
-    if not url or not token:
+    env_auth = get_auth_from_env()
+    if env_auth is None:
         raise ValueError(
             "No auth provided. Pass auth dict with canvas_base_url and canvas_access_token, "
             "or set CANVAS_API_URL and CANVAS_API_KEY environment variables."
         )
-    return AuthContext(canvas_base_url=url, canvas_access_token=token)
+    return env_auth
@@ -1,7 +1,9 @@
 """Bundle tool - delta bundle aggregator."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+from ..canvas_client import MAX_CONCURRENT_REQUESTS
 from ..utils.pagination import build_tool_output
 from .auth import resolve_auth
 from .announcements import canvas_list_announcements
@@ -16,6 +18,10 @@ from .schedule import (
     canvas_get_upcoming_events,
 )
 
+# Assignment/quiz descriptions are multi-KB HTML; the bundle only keeps a
+# preview, and the list tools return them in full when asked directly
+BUNDLE_DESCRIPTION_MAX_CHARS = 512
+
 
 def canvas_get_delta_bundle(
     auth: Optional[Dict[str, Any]] = None,
@@ -63,97 +69,108 @@ def canvas_get_delta_bundle(
         "course_data": {},
     }
 
-    # 1. Get profile
-    profile_result = canvas_get_profile(auth_ctx)
-    if profile_result.get("ok") and profile_result.get("items"):
-        bundle["profile"] = profile_result["items"][0]
-    if profile_result.get("errors"):
-        errors.extend(profile_result["errors"])
-
-    # 2. Get courses
-    courses_result = canvas_list_courses(
-        auth_ctx, enrollment_state="active", page=1, page_size=100, since=since
-    )
-    if courses_result.get("ok"):
-        bundle["courses"] = courses_result.get("items", [])
-    if courses_result.get("errors"):
-        errors.extend(courses_result["errors"])
-
-    # Determine course IDs to process
-    if course_ids is None:
-        course_ids = [c["id"] for c in bundle["courses"] if c.get("id")]
-
-    # 3. Get schedule items
-    todo_result = canvas_get_todo_items(auth_ctx, page=1, page_size=100, since=since)
-    if todo_result.get("ok"):
-        bundle["todo_items"] = todo_result.get("items", [])
-    if todo_result.get("errors"):
-        errors.extend(todo_result["errors"])
-
-    upcoming_result = canvas_get_upcoming_events(auth_ctx, page=1, page_size=100, since=since)
-    if upcoming_result.get("ok"):
-        bundle["upcoming_events"] = upcoming_result.get("items", [])
-    if upcoming_result.get("errors"):
-        errors.extend(upcoming_result["errors"])
-
-    calendar_result = canvas_get_calendar_events(auth_ctx, page=1, page_size=100, since=since)
-    if calendar_result.get("ok"):
-        bundle["calendar_events"] = calendar_result.get("items", [])
-    if calendar_result.get("errors"):
-        errors.extend(calendar_result["errors"])
-
-    planner_result = canvas_get_planner_items(auth_ctx, page=1, page_size=100, since=since)
-    if planner_result.get("ok"):
-        bundle["planner_items"] = planner_result.get("items", [])
-    if planner_result.get("errors"):
-        errors.extend(planner_result["errors"])
-
-    # 4. Get course-specific data
-    for course_id in course_ids:
-        course_data: Dict[str, Any] = {
-            "assignments": [],
-            "quizzes": [],
-            "discussions": [],
-            "announcements": [],
-        }
-
-        # Assignments
-        assignments_result = canvas_list_assignments(
-            auth_ctx, course_id=course_id, page=1, page_size=100, include_submissions=True, since=since
+    # Sub-fetches are independent HTTP requests, so run them on a thread
+    # pool; results are still merged in a fixed order.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        profile_future = pool.submit(canvas_get_profile, auth_ctx)
+        courses_future = pool.submit(
+            canvas_list_courses,
+            auth_ctx, enrollment_state="active", page=1, page_size=100, since=since,
+        )
+        todo_future = pool.submit(
+            canvas_get_todo_items, auth_ctx, page=1, page_size=100, since=since
         )
-        if assignments_result.get("ok"):
-            course_data["assignments"] = assignments_result.get("items", [])
-        if assignments_result.get("errors"):
-            errors.extend(assignments_result["errors"])
-
-        # Quizzes
-        quizzes_result = canvas_list_quizzes(
-            auth_ctx, course_id=course_id, page=1, page_size=100, since=since
+        upcoming_future = pool.submit(
+            canvas_get_upcoming_events, auth_ctx, page=1, page_size=100, since=since
         )
-        if quizzes_result.get("ok"):
-            course_data["quizzes"] = quizzes_result.get("items", [])
-        if quizzes_result.get("errors"):
-            errors.extend(quizzes_result["errors"])
-
-        # Discussions (not announcements)
-        discussions_result = canvas_list_discussion_topics(
-            auth_ctx, course_id=course_id, page=1, page_size=100, only_announcements=False, since=since
+        calendar_future = pool.submit(
+            canvas_get_calendar_events, auth_ctx, page=1, page_size=100, since=since
         )
-        if discussions_result.get("ok"):
-            course_data["discussions"] = discussions_result.get("items", [])
-        if discussions_result.get("errors"):
-            errors.extend(discussions_result["errors"])
-
-        # Announcements
-        announcements_result = canvas_list_announcements(
-            auth_ctx, course_ids=[course_id], page=1, page_size=50, since=since
+        planner_future = pool.submit(
+            canvas_get_planner_items, auth_ctx, page=1, page_size=100, since=since
         )
-        if announcements_result.get("ok"):
-            course_data["announcements"] = announcements_result.get("items", [])
-        if announcements_result.get("errors"):
-            errors.extend(announcements_result["errors"])
 
-        bundle["course_data"][str(course_id)] = course_data
+        # 1. Get profile
+        profile_result = profile_future.result()
+        if profile_result.get("ok") and profile_result.get("items"):
+            bundle["profile"] = profile_result["items"][0]
+        if profile_result.get("errors"):
+            errors.extend(profile_result["errors"])
+
+        # 2. Get courses
+        courses_result = courses_future.result()
+        if courses_result.get("ok"):
+            bundle["courses"] = courses_result.get("items", [])
+        if courses_result.get("errors"):
+            errors.extend(courses_result["errors"])
+
+        # Determine course IDs to process
+        if course_ids is None:
+            course_ids = [c["id"] for c in bundle["courses"] if c.get("id")]
+        # Fetch each course once even if it was listed more than once
+        course_ids = list(dict.fromkeys(course_ids))
+
+        # Queue course-specific fetches before waiting on schedule items
+        course_futures = [
+            (
+                course_id,
+                {
+                    "assignments": pool.submit(
+                        canvas_list_assignments,
+                        auth_ctx, course_id=course_id, page=1, page_size=100,
+                        include_submissions=True, since=since,
+                        description_max_chars=BUNDLE_DESCRIPTION_MAX_CHARS,
+                    ),
+                    "quizzes": pool.submit(
+                        canvas_list_quizzes,
+                        auth_ctx, course_id=course_id, page=1, page_size=100, since=since,
+                        description_max_chars=BUNDLE_DESCRIPTION_MAX_CHARS,
+                    ),
+                    # Discussions (not announcements)
+                    "discussions": pool.submit(
+                        canvas_list_discussion_topics,
+                        auth_ctx, course_id=course_id, page=1, page_size=100,
+                        only_announcements=False, since=since,
+                    ),
+                    "announcements": pool.submit(
+                        canvas_list_announcements,
+                        auth_ctx, course_ids=[course_id], page=1, page_size=50, since=since,
+                    ),
+                },
+            )
+            for course_id in course_ids
+        ]
+
+        # 3. Get schedule items
+        for key, future in (
+            ("todo_items", todo_future),
+            ("upcoming_events", upcoming_future),
+            ("calendar_events", calendar_future),
+            ("planner_items", planner_future),
+        ):
+            result = future.result()
+            if result.get("ok"):
+                bundle[key] = result.get("items", [])
+            if result.get("errors"):
+                errors.extend(result["errors"])
+
+        # 4. Get course-specific data
+        for course_id, futures in course_futures:
+            course_data: Dict[str, Any] = {
+                "assignments": [],
+                "quizzes": [],
+                "discussions": [],
+                "announcements": [],
+            }
+
+            for key, future in futures.items():
+                result = future.result()
+                if result.get("ok"):
+                    course_data[key] = result.get("items", [])
+                if result.get("errors"):
+                    errors.extend(result["errors"])
+
+            bundle["course_data"][str(course_id)] = course_data
 
     return build_tool_output(
         tool="canvas_get_delta_bundle",
@@ -4,53 +4,93 @@ from typing import Any, Dict, List, Optional
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
-from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output
+from ..canvas_client import CANVAS_PER_PAGE, get_cached_client
+from ..utils.normalize_time import filter_since, normalize_canvas_time
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
+from .listing import run_list_tool
+
+
+# Fields read from a conversation payload
+CONVERSATION_FIELDS = (
+    "id",
+    "subject",
+    "workflow_state",
+    "last_message",
+    "last_message_at",
+    "message_count",
+    "participants",
+    "starred",
+    "subscribed",
+    "audience",
+    "context_code",
+    "context_name",
+    "url",
+    "created_at",
+    "updated_at",
+)
 
 
 def serialize_conversation(convo: Any) -> Dict[str, Any]:
     """Serialize a Canvas Conversation to dict."""
+    get = raw_fields(convo, CONVERSATION_FIELDS).get
     return {
-        "id": getattr(convo, "id", None),
-        "subject": getattr(convo, "subject", None),
-        "workflow_state": getattr(convo, "workflow_state", None),
-        "last_message": getattr(convo, "last_message", None),
-        "last_message_at": normalize_canvas_time(getattr(convo, "last_message_at", None)),
-        "message_count": getattr(convo, "message_count", 0),
+        "id": get("id"),
+        "subject": get("subject"),
+        "workflow_state": get("workflow_state"),
+        "last_message": get("last_message"),
+        "last_message_at": normalize_canvas_time(get("last_message_at")),
+        "message_count": get("message_count", 0),
         "participants": [
             {
                 "id": p.get("id") if isinstance(p, dict) else getattr(p, "id", None),
                 "name": p.get("name") if isinstance(p, dict) else getattr(p, "name", None),
             }
-            for p in (getattr(convo, "participants", []) or [])
+            for p in get("participants") or ()
         ],
-        "starred": getattr(convo, "starred", False),
-        "subscribed": getattr(convo, "subscribed", True),
-        "audience": getattr(convo, "audience", []),
-        "context_code": getattr(convo, "context_code", None),
-        "context_name": getattr(convo, "context_name", None),
-        "url": getattr(convo, "url", None),
-        "created_at": normalize_canvas_time(getattr(convo, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(convo, "updated_at", None)),
+        "starred": get("starred", False),
+        "subscribed": get("subscribed", True),
+        "audience": get("audience", []),
+        "context_code": get("context_code"),
+        "context_name": get("context_name"),
+        "url": get("url"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
+# Fields read from a conversation message payload
+CONVERSATION_MESSAGE_FIELDS = (
+    "id",
+    "body",
+    "author_id",
+    "author_name",
+    "conversation_id",
+    "created_at",
+    "generated",
+    "media_comment",
+    "forwarded_messages",
+    "attachments",
+    "participating_user_ids",
+)
+
+
 def serialize_conversation_message(msg: Any) -> Dict[str, Any]:
     """Serialize a Canvas Conversation Message to dict."""
+    get = raw_fields(msg, CONVERSATION_MESSAGE_FIELDS).get
     return {
-        "id": getattr(msg, "id", None),
-        "body": getattr(msg, "body", None),
-        "author_id": getattr(msg, "author_id", None),
-        "author_name": getattr(msg, "author_name", None),
-        "conversation_id": getattr(msg, "conversation_id", None),
-        "created_at": normalize_canvas_time(getattr(msg, "created_at", None)),
-        "generated": getattr(msg, "generated", False),
-        "media_comment": getattr(msg, "media_comment", None),
-        "forwarded_messages": getattr(msg, "forwarded_messages", []),
-        "attachments": getattr(msg, "attachments", []),
-        "participating_user_ids": getattr(msg, "participating_user_ids", []),
+        "id": get("id"),
+        "body": get("body"),
+        "author_id": get("author_id"),
+        "author_name": get("author_name"),
+        "conversation_id": get("conversation_id"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "generated": get("generated", False),
+        "media_comment": get("media_comment"),
+        "forwarded_messages": get("forwarded_messages", []),
+        "attachments": get("attachments", []),
+        "participating_user_ids": get("participating_user_ids", []),
     }
 
 
@@ -75,61 +115,19 @@ def canvas_list_conversations(
     Returns:
         Tool output with conversations
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        canvas = client.client
-
-        kwargs: Dict[str, Any] = {}
-        if scope:
-            kwargs["scope"] = scope
-
-        paginated = canvas.get_conversations(**kwargs)
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
+    kwargs: Dict[str, Any] = {}
+    if scope:
+        kwargs["scope"] = scope
 
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        convos = [serialize_conversation(convo) for convo in items]
-
-        return build_tool_output(
-            tool="canvas_list_conversations",
-            items=convos,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_conversations",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_conversations",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    return run_list_tool(
+        "canvas_list_conversations",
+        auth,
+        lambda client: client.client.get_conversations(per_page=CANVAS_PER_PAGE, **kwargs),
+        serialize_conversation,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
 
 
 def canvas_get_conversation(
@@ -153,7 +151,7 @@ def canvas_get_conversation(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         canvas = client.client
 
         convo = canvas.get_conversation(conversation_id, include=["messages"])
@@ -161,15 +159,9 @@ def canvas_get_conversation(
         convo_data = serialize_conversation(convo)
 
         # Add messages
-        messages = getattr(convo, "messages", []) or []
+        messages = getattr(convo, "messages", None) or ()
         if since:
-            from ..utils.normalize_time import is_after
-
-            messages = [
-                msg
-                for msg in messages
-                if is_after(getattr(msg, "created_at", None), since)
-            ]
+            messages = filter_since(messages, since, "created_at")
 
         convo_data["messages"] = [serialize_conversation_message(msg) for msg in messages]
 
@@ -184,21 +176,11 @@ def canvas_get_conversation(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_conversation",
-            items=[],
-            page=1,
-            page_size=1,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_conversation", page=1, page_size=1, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_conversation",
-            items=[],
-            page=1,
-            page_size=1,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_conversation", page=1, page_size=1, errors=errors
         )
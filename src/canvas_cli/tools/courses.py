@@ -1,41 +1,68 @@
 """Courses tool - canvas_list_courses."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
-from canvasapi.exceptions import CanvasException
-
-from ..canvas_client import CanvasClient
+from ..canvas_client import CANVAS_PER_PAGE
 from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output, slice_items
-from .auth import resolve_auth
+from ..utils.serialize import raw_fields
+from .listing import run_list_tool
+
+
+# Fields read from a course payload
+COURSE_FIELDS = (
+    "id",
+    "name",
+    "course_code",
+    "workflow_state",
+    "enrollment_term_id",
+    "start_at",
+    "end_at",
+    "created_at",
+    "updated_at",
+    "syllabus_body",
+    "public_description",
+    "enrollments",
+    "calendar",
+    "default_view",
+    "is_public",
+    "has_active_course_offering",
+)
+
+
+# Fields read from each of a course's enrollments
+ENROLLMENT_FIELDS = ("type", "role", "enrollment_state")
+
+
+def _serialize_enrollment(enrollment: Any) -> Dict[str, Any]:
+    """Serialize a course enrollment (raw JSON dict or object) to dict."""
+    get = raw_fields(enrollment, ENROLLMENT_FIELDS).get
+    return {
+        "type": get("type"),
+        "role": get("role"),
+        "enrollment_state": get("enrollment_state"),
+    }
 
 
 def serialize_course(course: Any) -> Dict[str, Any]:
     """Serialize a Canvas Course to dict."""
+    get = raw_fields(course, COURSE_FIELDS).get
     return {
-        "id": getattr(course, "id", None),
-        "name": getattr(course, "name", None),
-        "course_code": getattr(course, "course_code", None),
-        "workflow_state": getattr(course, "workflow_state", None),
-        "enrollment_term_id": getattr(course, "enrollment_term_id", None),
-        "start_at": normalize_canvas_time(getattr(course, "start_at", None)),
-        "end_at": normalize_canvas_time(getattr(course, "end_at", None)),
-        "created_at": normalize_canvas_time(getattr(course, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(course, "updated_at", None)),
-        "syllabus_body": getattr(course, "syllabus_body", None),
-        "public_description": getattr(course, "public_description", None),
-        "enrollments": [
-            {
-                "type": getattr(e, "type", None),
-                "role": getattr(e, "role", None),
-                "enrollment_state": getattr(e, "enrollment_state", None),
-            }
-            for e in (getattr(course, "enrollments", []) or [])
-        ],
-        "calendar": getattr(course, "calendar", None),
-        "default_view": getattr(course, "default_view", None),
-        "is_public": getattr(course, "is_public", None),
-        "has_active_course_offering": getattr(course, "has_active_course_offering", None),
+        "id": get("id"),
+        "name": get("name"),
+        "course_code": get("course_code"),
+        "workflow_state": get("workflow_state"),
+        "enrollment_term_id": get("enrollment_term_id"),
+        "start_at": normalize_canvas_time(get("start_at")),
+        "end_at": normalize_canvas_time(get("end_at")),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "syllabus_body": get("syllabus_body"),
+        "public_description": get("public_description"),
+        "enrollments": [_serialize_enrollment(e) for e in get("enrollments") or ()],
+        "calendar": get("calendar"),
+        "default_view": get("default_view"),
+        "is_public": get("is_public"),
+        "has_active_course_offering": get("has_active_course_offering"),
     }
 
 
@@ -60,61 +87,18 @@ def canvas_list_courses(
     Returns:
         Tool output with course data
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        user = client.get_current_user()
-
-        # Build kwargs for get_courses
-        kwargs: Dict[str, Any] = {}
-        if enrollment_state:
-            kwargs["enrollment_state"] = [enrollment_state]
-
-        # Get paginated list
-        paginated = user.get_courses(**kwargs)
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        # Serialize courses
-        courses = [serialize_course(course) for course in items]
-
-        return build_tool_output(
-            tool="canvas_list_courses",
-            items=courses,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_courses",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_courses",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    kwargs: Dict[str, Any] = {}
+    if enrollment_state:
+        kwargs["enrollment_state"] = [enrollment_state]
+
+    return run_list_tool(
+        "canvas_list_courses",
+        auth,
+        lambda client: client.get_current_user().get_courses(
+            per_page=CANVAS_PER_PAGE, **kwargs
+        ),
+        serialize_course,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
@@ -1,35 +1,63 @@
 """Discussion tools - topics, entries, replies."""
 
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
-from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output
+from ..canvas_client import CANVAS_PER_PAGE, get_cached_client
+from ..utils.normalize_time import filter_since, normalize_canvas_time
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
+from .listing import run_list_tool
+
+
+# Fields read from a discussion topic payload
+DISCUSSION_TOPIC_FIELDS = (
+    "id",
+    "title",
+    "message",
+    "course_id",
+    "discussion_type",
+    "discussion_subentry_count",
+    "published",
+    "locked",
+    "pinned",
+    "position",
+    "url",
+    "html_url",
+    "posted_at",
+    "created_at",
+    "updated_at",
+    "last_reply_at",
+    "author",
+    "is_announcement",
+    "has_more_replies",
+)
 
 
 def serialize_discussion_topic(topic: Any) -> Dict[str, Any]:
     """Serialize a Canvas Discussion Topic to dict."""
-    author = getattr(topic, "author", {}) or {}
+    get = raw_fields(topic, DISCUSSION_TOPIC_FIELDS).get
+    author = get("author", {}) or {}
     return {
-        "id": getattr(topic, "id", None),
-        "title": getattr(topic, "title", None),
-        "message": getattr(topic, "message", None),
-        "course_id": getattr(topic, "course_id", None),
-        "discussion_type": getattr(topic, "discussion_type", None),
-        "discussion_subentry_count": getattr(topic, "discussion_subentry_count", 0),
-        "published": getattr(topic, "published", None),
-        "locked": getattr(topic, "locked", None),
-        "pinned": getattr(topic, "pinned", None),
-        "position": getattr(topic, "position", None),
-        "url": getattr(topic, "url", None),
-        "html_url": getattr(topic, "html_url", None),
-        "posted_at": normalize_canvas_time(getattr(topic, "posted_at", None)),
-        "created_at": normalize_canvas_time(getattr(topic, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(topic, "updated_at", None)),
-        "last_reply_at": normalize_canvas_time(getattr(topic, "last_reply_at", None)),
+        "id": get("id"),
+        "title": get("title"),
+        "message": get("message"),
+        "course_id": get("course_id"),
+        "discussion_type": get("discussion_type"),
+        "discussion_subentry_count": get("discussion_subentry_count", 0),
+        "published": get("published"),
+        "locked": get("locked"),
+        "pinned": get("pinned"),
+        "position": get("position"),
+        "url": get("url"),
+        "html_url": get("html_url"),
+        "posted_at": normalize_canvas_time(get("posted_at")),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "last_reply_at": normalize_canvas_time(get("last_reply_at")),
         "author": {
             "id": author.get("id") if isinstance(author, dict) else None,
             "display_name": author.get("display_name") if isinstance(author, dict) else None,
@@ -37,25 +65,42 @@ def serialize_discussion_topic(topic: Any) -> Dict[str, Any]:
             if isinstance(author, dict)
             else None,
         },
-        "is_announcement": getattr(topic, "is_announcement", False),
-        "has_more_replies": getattr(topic, "has_more_replies", False),
+        "is_announcement": get("is_announcement", False),
+        "has_more_replies": get("has_more_replies", False),
     }
 
 
+# Fields read from a discussion entry payload
+DISCUSSION_ENTRY_FIELDS = (
+    "id",
+    "user_id",
+    "user_name",
+    "message",
+    "created_at",
+    "updated_at",
+    "parent_id",
+    "read_state",
+    "forced_read_state",
+    "discussion_subentry_count",
+    "has_more_replies",
+)
+
+
 def serialize_discussion_entry(entry: Any) -> Dict[str, Any]:
     """Serialize a Canvas Discussion Entry to dict."""
+    get = raw_fields(entry, DISCUSSION_ENTRY_FIELDS).get
     return {
-        "id": getattr(entry, "id", None),
-        "user_id": getattr(entry, "user_id", None),
-        "user_name": getattr(entry, "user_name", None),
-        "message": getattr(entry, "message", None),
-        "created_at": normalize_canvas_time(getattr(entry, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(entry, "updated_at", None)),
-        "parent_id": getattr(entry, "parent_id", None),
-        "read_state": getattr(entry, "read_state", None),
-        "forced_read_state": getattr(entry, "forced_read_state", None),
-        "discussion_subentry_count": getattr(entry, "discussion_subentry_count", 0),
-        "has_more_replies": getattr(entry, "has_more_replies", False),
+        "id": get("id"),
+        "user_id": get("user_id"),
+        "user_name": get("user_name"),
+        "message": get("message"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "parent_id": get("parent_id"),
+        "read_state": get("read_state"),
+        "forced_read_state": get("forced_read_state"),
+        "discussion_subentry_count": get("discussion_subentry_count", 0),
+        "has_more_replies": get("has_more_replies", False),
     }
 
 
@@ -88,61 +133,21 @@ def canvas_list_discussion_topics(
     Returns:
         Tool output with discussion topics
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
-
-        kwargs: Dict[str, Any] = {}
-        if only_announcements:
-            kwargs["only_announcements"] = True
-
-        paginated = course.get_discussion_topics(**kwargs)
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        topics = [serialize_discussion_topic(topic) for topic in items]
-
-        return build_tool_output(
-            tool="canvas_list_discussion_topics",
-            items=topics,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_discussion_topics",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_discussion_topics",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    kwargs: Dict[str, Any] = {}
+    if only_announcements:
+        kwargs["only_announcements"] = True
+
+    return run_list_tool(
+        "canvas_list_discussion_topics",
+        auth,
+        lambda client: client.get_course(course_id).get_discussion_topics(
+            per_page=CANVAS_PER_PAGE, **kwargs
+        ),
+        serialize_discussion_topic,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
 
 
 def canvas_get_discussion_entries(
@@ -168,60 +173,17 @@ def canvas_get_discussion_entries(
     Returns:
         Tool output with discussion entries
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
-
-        # Get the topic first
-        topic = course.get_discussion_topic(topic_id)
-
-        paginated = topic.get_topic_entries()
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        entries = [serialize_discussion_entry(entry) for entry in items]
-
-        return build_tool_output(
-            tool="canvas_get_discussion_entries",
-            items=entries,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_discussion_entries",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_discussion_entries",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    return run_list_tool(
+        "canvas_get_discussion_entries",
+        auth,
+        lambda client: client.get_course(course_id)
+        .get_discussion_topic(topic_id)
+        .get_topic_entries(per_page=CANVAS_PER_PAGE),
+        serialize_discussion_entry,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
 
 
 def canvas_get_discussion_replies(
@@ -253,28 +215,24 @@ def canvas_get_discussion_replies(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
+        client = get_cached_client(auth_ctx)
 
-        # Get the topic
-        topic = course.get_discussion_topic(topic_id)
+        # The replies endpoint only needs the three IDs, so list it straight
+        # from a local entry stub instead of fetching course, topic and entry
+        entry = client.discussion_entry_stub(course_id, topic_id, entry_id)
+        paginated = entry.get_replies(per_page=CANVAS_PER_PAGE)
 
-        # Get the entry
-        entry = topic.get_topic_entries(entry_id)  # type: ignore
-
-        # Get replies
-        paginated = entry.get_replies()
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
+        # Take the window directly rather than via extract_paginated_list,
+        # which swallows errors: with no prior lookups, this request is the
+        # one that reports an invalid course, topic or entry ID
+        start_idx = (page - 1) * page_size
+        window = list(islice(paginated, start_idx, start_idx + page_size + 1))
+        items = window[:page_size]
+        has_more = len(window) > page_size
 
         # Filter by since if provided
         if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
+            items = filter_since(items, since)
 
         replies = [serialize_discussion_reply(reply) for reply in items]
 
@@ -289,21 +247,11 @@ def canvas_get_discussion_replies(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_discussion_replies",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_discussion_replies", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_discussion_replies",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_discussion_replies", page=page, page_size=page_size, errors=errors
         )
@@ -0,0 +1,66 @@
+"""Shared body of the paginated list tools."""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from canvasapi.exceptions import CanvasException
+
+from ..canvas_client import CanvasClient, get_cached_client
+from ..utils.normalize_time import filter_since
+from ..utils.pagination import build_error_output, build_tool_output
+from .auth import resolve_auth
+
+
+def run_list_tool(
+    tool: str,
+    auth: Optional[Dict[str, Any]],
+    fetch: Callable[[CanvasClient], Any],
+    serialize: Callable[[Any], Dict[str, Any]],
+    *,
+    page: int,
+    page_size: int,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a list tool: fetch, take the page, filter by since, serialize.
+
+    Args:
+        tool: Name of the tool, used in the output
+        auth: Canvas auth with canvas_base_url and canvas_access_token
+        fetch: Returns the PaginatedList to read, given the Canvas client
+        serialize: Converts one Canvas object to its output dict
+        page: Page number (1-indexed)
+        page_size: Items per page
+        since: ISO timestamp for delta fetch
+
+    Returns:
+        Tool output with the serialized items, or the error output if
+        any step raised
+    """
+    errors: List[str] = []
+
+    try:
+        auth_ctx = resolve_auth(auth)
+        client = get_cached_client(auth_ctx)
+
+        paginated = fetch(client)
+        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
+
+        # Filter by since if provided (nothing to do on an empty page)
+        if since and items:
+            items = filter_since(items, since)
+
+        return build_tool_output(
+            tool=tool,
+            items=[serialize(item) for item in items],
+            page=page,
+            page_size=page_size,
+            has_more=has_more,
+            errors=errors,
+        )
+
+    except CanvasException as e:
+        errors.append(f"Canvas API error: {e}")
+        return build_error_output(tool=tool, page=page, page_size=page_size, errors=errors)
+    except Exception as e:
+        errors.append(f"Unexpected error: {e}")
+        return build_error_output(tool=tool, page=page, page_size=page_size, errors=errors)
@@ -4,26 +4,44 @@ from typing import Any, Dict, Optional
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
-from ..utils.normalize_time import normalize_canvas_time, to_iso
-from ..utils.pagination import build_tool_output
+from ..canvas_client import get_cached_client
+from ..utils.normalize_time import normalize_canvas_time
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
 
 
+# Fields read from a user profile payload
+PROFILE_FIELDS = (
+    "id",
+    "name",
+    "short_name",
+    "login_id",
+    "email",
+    "locale",
+    "time_zone",
+    "bio",
+    "avatar_url",
+    "created_at",
+    "updated_at",
+)
+
+
 def serialize_profile(user: Any) -> Dict[str, Any]:
     """Serialize a Canvas User/profile to dict."""
+    get = raw_fields(user, PROFILE_FIELDS).get
     return {
-        "id": getattr(user, "id", None),
-        "name": getattr(user, "name", None),
-        "short_name": getattr(user, "short_name", None),
-        "login_id": getattr(user, "login_id", None),
-        "email": getattr(user, "email", None),
-        "locale": getattr(user, "locale", None),
-        "time_zone": getattr(user, "time_zone", None),
-        "bio": getattr(user, "bio", None),
-        "avatar_url": getattr(user, "avatar_url", None),
-        "created_at": normalize_canvas_time(getattr(user, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(user, "updated_at", None)),
+        "id": get("id"),
+        "name": get("name"),
+        "short_name": get("short_name"),
+        "login_id": get("login_id"),
+        "email": get("email"),
+        "locale": get("locale"),
+        "time_zone": get("time_zone"),
+        "bio": get("bio"),
+        "avatar_url": get("avatar_url"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
@@ -41,7 +59,7 @@ def canvas_get_profile(auth: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         user = client.get_current_user()
 
         profile_data = serialize_profile(user)
@@ -57,21 +75,7 @@ def canvas_get_profile(auth: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_profile",
-            items=[],
-            page=1,
-            page_size=1,
-            has_more=False,
-            errors=errors,
-        )
+        return build_error_output(tool="canvas_get_profile", page=1, page_size=1, errors=errors)
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_profile",
-            items=[],
-            page=1,
-            page_size=1,
-            has_more=False,
-            errors=errors,
-        )
+        return build_error_output(tool="canvas_get_profile", page=1, page_size=1, errors=errors)
@@ -2,72 +2,127 @@
 
 from typing import Any, Dict, List, Optional
 
-import httpx
+import requests
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
+from ..canvas_client import CANVAS_PER_PAGE, CanvasClient, get_cached_client
 from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output, slice_items
+from ..utils.pagination import build_error_output, build_tool_output, slice_items
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
 
 
+# Fields read from a todo item payload
+TODO_FIELDS = (
+    "id",
+    "type",
+    "assignment_id",
+    "course_id",
+    "html_url",
+    "assignment",
+    "context_name",
+    "needs_grading_count",
+    "ignore",
+    "ignore_permanently",
+)
+
+
 def serialize_todo(todo: Any) -> Dict[str, Any]:
     """Serialize a todo item to dict."""
+    get = raw_fields(todo, TODO_FIELDS).get
     return {
-        "id": getattr(todo, "id", None),
-        "type": getattr(todo, "type", None),
-        "assignment_id": getattr(todo, "assignment_id", None),
-        "course_id": getattr(todo, "course_id", None),
-        "html_url": getattr(todo, "html_url", None),
-        "name": getattr(todo, "assignment", {}).get("name") if hasattr(todo, "assignment") else None,
-        "context_name": getattr(todo, "context_name", None),
-        "needs_grading_count": getattr(todo, "needs_grading_count", None),
-        "ignore": getattr(todo, "ignore", None),
-        "ignore_permanently": getattr(todo, "ignore_permanently", None),
+        "id": get("id"),
+        "type": get("type"),
+        "assignment_id": get("assignment_id"),
+        "course_id": get("course_id"),
+        "html_url": get("html_url"),
+        "name": (get("assignment") or {}).get("name"),
+        "context_name": get("context_name"),
+        "needs_grading_count": get("needs_grading_count"),
+        "ignore": get("ignore"),
+        "ignore_permanently": get("ignore_permanently"),
     }
 
 
+# Fields read from a calendar event payload
+CALENDAR_EVENT_FIELDS = (
+    "id",
+    "title",
+    "start_at",
+    "end_at",
+    "description",
+    "location_name",
+    "location_address",
+    "context_code",
+    "workflow_state",
+    "hidden",
+    "url",
+    "html_url",
+    "all_day",
+    "created_at",
+    "updated_at",
+)
+
+
 def serialize_calendar_event(event: Any) -> Dict[str, Any]:
     """Serialize a calendar event to dict."""
+    get = raw_fields(event, CALENDAR_EVENT_FIELDS).get
     return {
-        "id": getattr(event, "id", None),
-        "title": getattr(event, "title", None),
-        "start_at": normalize_canvas_time(getattr(event, "start_at", None)),
-        "end_at": normalize_canvas_time(getattr(event, "end_at", None)),
-        "description": getattr(event, "description", None),
-        "location_name": getattr(event, "location_name", None),
-        "location_address": getattr(event, "location_address", None),
-        "context_code": getattr(event, "context_code", None),
-        "workflow_state": getattr(event, "workflow_state", None),
-        "hidden": getattr(event, "hidden", None),
-        "url": getattr(event, "url", None),
-        "html_url": getattr(event, "html_url", None),
-        "all_day": getattr(event, "all_day", None),
-        "created_at": normalize_canvas_time(getattr(event, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(event, "updated_at", None)),
+        "id": get("id"),
+        "title": get("title"),
+        "start_at": normalize_canvas_time(get("start_at")),
+        "end_at": normalize_canvas_time(get("end_at")),
+        "description": get("description"),
+        "location_name": get("location_name"),
+        "location_address": get("location_address"),
+        "context_code": get("context_code"),
+        "workflow_state": get("workflow_state"),
+        "hidden": get("hidden"),
+        "url": get("url"),
+        "html_url": get("html_url"),
+        "all_day": get("all_day"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
+# Fields read from an upcoming event payload
+UPCOMING_EVENT_FIELDS = (
+    "id",
+    "title",
+    "name",
+    "type",
+    "html_url",
+    "due_at",
+    "course_id",
+    "start_at",
+    "end_at",
+)
+
+
 def serialize_upcoming_event(event: Any) -> Dict[str, Any]:
     """Serialize an upcoming event to dict."""
+    # canvasapi returns upcoming events as raw dicts
+    fields = raw_fields(event, UPCOMING_EVENT_FIELDS)
+    get = fields.get
+
     # Upcoming events can be assignments or calendar events
     result = {
-        "id": getattr(event, "id", None),
-        "title": getattr(event, "title", None)
-        or getattr(event, "name", None),
-        "type": getattr(event, "type", None),
-        "html_url": getattr(event, "html_url", None),
+        "id": get("id"),
+        "title": get("title") or get("name"),
+        "type": get("type"),
+        "html_url": get("html_url"),
     }
 
     # Handle assignment-like events
-    if hasattr(event, "due_at"):
-        result["due_at"] = normalize_canvas_time(event.due_at)
-        result["course_id"] = getattr(event, "course_id", None)
+    if "due_at" in fields:
+        result["due_at"] = normalize_canvas_time(fields["due_at"])
+        result["course_id"] = get("course_id")
 
     # Handle calendar-like events
-    if hasattr(event, "start_at"):
-        result["start_at"] = normalize_canvas_time(event.start_at)
-        result["end_at"] = normalize_canvas_time(getattr(event, "end_at", None))
+    if "start_at" in fields:
+        result["start_at"] = normalize_canvas_time(fields["start_at"])
+        result["end_at"] = normalize_canvas_time(get("end_at"))
 
     return result
 
@@ -114,10 +169,10 @@ def canvas_get_todo_items(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         canvas = client.client
 
-        paginated = canvas.get_todo_items()
+        paginated = canvas.get_todo_items(per_page=CANVAS_PER_PAGE)
         items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
 
         todos = [serialize_todo(todo) for todo in items]
@@ -133,23 +188,13 @@ def canvas_get_todo_items(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_todo_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_todo_items", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_todo_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_todo_items", page=page, page_size=page_size, errors=errors
         )
 
 
@@ -176,7 +221,7 @@ def canvas_get_upcoming_events(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         canvas = client.client
 
         # get_upcoming_events returns a list, not PaginatedList
@@ -198,23 +243,13 @@ def canvas_get_upcoming_events(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_upcoming_events",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_upcoming_events", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_upcoming_events",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_upcoming_events", page=page, page_size=page_size, errors=errors
         )
 
 
@@ -247,7 +282,7 @@ def canvas_get_calendar_events(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
 
         kwargs: Dict[str, Any] = {}
         if start_date:
@@ -258,7 +293,7 @@ def canvas_get_calendar_events(
             kwargs["context_codes"] = context_codes
 
         canvas = client.client
-        paginated = canvas.get_calendar_events(**kwargs)
+        paginated = canvas.get_calendar_events(per_page=CANVAS_PER_PAGE, **kwargs)
         items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
 
         events = [serialize_calendar_event(event) for event in items]
@@ -274,23 +309,13 @@ def canvas_get_calendar_events(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_calendar_events",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_calendar_events", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_calendar_events",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_calendar_events", page=page, page_size=page_size, errors=errors
         )
 
 
@@ -307,7 +332,8 @@ def canvas_get_planner_items(
     """
     Get planner items for the current user via direct HTTP request.
 
-    The planner API is not fully supported by canvasapi, so we use httpx.
+    The planner API is not fully supported by canvasapi, so we request it
+    directly over the client's pooled session.
 
     Args:
         auth: Canvas auth with canvas_base_url and canvas_access_token
@@ -325,7 +351,7 @@ def canvas_get_planner_items(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         base_url = client.base_url
 
         # Build URL
@@ -346,10 +372,11 @@ def canvas_get_planner_items(
 
         headers = {"Authorization": f"Bearer {client.access_token}"}
 
-        with httpx.Client() as http_client:
-            response = http_client.get(url, params=params, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
+        # Reuse the client's keep-alive session rather than opening (and
+        # handshaking) a new connection on every call
+        response = client.session.get(url, params=params, headers=headers, timeout=30.0)
+        response.raise_for_status()
+        data = response.json()
 
         # Check for more pages via Link header
         has_more = 'rel="next"' in response.headers.get("link", "")
@@ -366,33 +393,18 @@ def canvas_get_planner_items(
             errors=errors,
         )
 
-    except httpx.HTTPStatusError as e:
+    except requests.HTTPError as e:
         errors.append(f"HTTP error: {e.response.status_code} - {e.response.text}")
-        return build_tool_output(
-            tool="canvas_get_planner_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_planner_items", page=page, page_size=page_size, errors=errors
         )
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_get_planner_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_planner_items", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_get_planner_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_get_planner_items", page=page, page_size=page_size, errors=errors
         )
@@ -1,99 +1,197 @@
 """Structure tools - modules, pages, files."""
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from canvasapi.exceptions import CanvasException
 
-from ..canvas_client import CanvasClient
+from ..canvas_client import (
+    CANVAS_PER_PAGE,
+    MAX_CONCURRENT_REQUESTS,
+    CanvasClient,
+    get_cached_client,
+)
 from ..utils.normalize_time import normalize_canvas_time
-from ..utils.pagination import build_tool_output
+from ..utils.pagination import build_error_output, build_tool_output
+from ..utils.serialize import raw_fields
 from .auth import resolve_auth
+from .listing import run_list_tool
+
+
+# Fields read from a module payload
+MODULE_FIELDS = (
+    "id",
+    "name",
+    "course_id",
+    "position",
+    "unlock_at",
+    "require_sequential_progress",
+    "publish_final_grade",
+    "published",
+    "items_count",
+    "items_url",
+    "state",
+    "completed_at",
+    "created_at",
+    "updated_at",
+)
 
 
 def serialize_module(module: Any) -> Dict[str, Any]:
     """Serialize a Canvas Module to dict."""
+    get = raw_fields(module, MODULE_FIELDS).get
     return {
-        "id": getattr(module, "id", None),
-        "name": getattr(module, "name", None),
-        "course_id": getattr(module, "course_id", None),
-        "position": getattr(module, "position", None),
-        "unlock_at": normalize_canvas_time(getattr(module, "unlock_at", None)),
-        "require_sequential_progress": getattr(module, "require_sequential_progress", False),
-        "publish_final_grade": getattr(module, "publish_final_grade", False),
-        "published": getattr(module, "published", None),
-        "items_count": getattr(module, "items_count", None),
-        "items_url": getattr(module, "items_url", None),
-        "state": getattr(module, "state", None),
-        "completed_at": normalize_canvas_time(getattr(module, "completed_at", None)),
-        "created_at": normalize_canvas_time(getattr(module, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(module, "updated_at", None)),
+        "id": get("id"),
+        "name": get("name"),
+        "course_id": get("course_id"),
+        "position": get("position"),
+        "unlock_at": normalize_canvas_time(get("unlock_at")),
+        "require_sequential_progress": get("require_sequential_progress", False),
+        "publish_final_grade": get("publish_final_grade", False),
+        "published": get("published"),
+        "items_count": get("items_count"),
+        "items_url": get("items_url"),
+        "state": get("state"),
+        "completed_at": normalize_canvas_time(get("completed_at")),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
+# Fields read from a module item payload
+MODULE_ITEM_FIELDS = (
+    "id",
+    "module_id",
+    "position",
+    "title",
+    "type",
+    "content_id",
+    "content_type",
+    "html_url",
+    "url",
+    "external_url",
+    "page_url",
+    "indent",
+    "completion_requirement",
+    "published",
+    "new_tab",
+    "created_at",
+    "updated_at",
+)
+
+
 def serialize_module_item(item: Any) -> Dict[str, Any]:
     """Serialize a Canvas Module Item to dict."""
+    get = raw_fields(item, MODULE_ITEM_FIELDS).get
     return {
-        "id": getattr(item, "id", None),
-        "module_id": getattr(item, "module_id", None),
-        "position": getattr(item, "position", None),
-        "title": getattr(item, "title", None),
-        "type": getattr(item, "type", None),
-        "content_id": getattr(item, "content_id", None),
-        "content_type": getattr(item, "content_type", None),
-        "html_url": getattr(item, "html_url", None),
-        "url": getattr(item, "url", None),
-        "external_url": getattr(item, "external_url", None),
-        "page_url": getattr(item, "page_url", None),
-        "indent": getattr(item, "indent", None),
-        "completion_requirement": getattr(item, "completion_requirement", None),
-        "published": getattr(item, "published", None),
-        "new_tab": getattr(item, "new_tab", False),
-        "created_at": normalize_canvas_time(getattr(item, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(item, "updated_at", None)),
+        "id": get("id"),
+        "module_id": get("module_id"),
+        "position": get("position"),
+        "title": get("title"),
+        "type": get("type"),
+        "content_id": get("content_id"),
+        "content_type": get("content_type"),
+        "html_url": get("html_url"),
+        "url": get("url"),
+        "external_url": get("external_url"),
+        "page_url": get("page_url"),
+        "indent": get("indent"),
+        "completion_requirement": get("completion_requirement"),
+        "published": get("published"),
+        "new_tab": get("new_tab", False),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
 
 
-def serialize_page(page: Any) -> Dict[str, Any]:
-    """Serialize a Canvas Page to dict."""
-    return {
-        "id": getattr(page, "page_id", None) or getattr(page, "id", None),
-        "url": getattr(page, "url", None),
-        "title": getattr(page, "title", None),
-        "body": getattr(page, "body", None),
-        "course_id": getattr(page, "course_id", None),
-        "front_page": getattr(page, "front_page", False),
-        "published": getattr(page, "published", None),
-        "hide_from_students": getattr(page, "hide_from_students", False),
-        "editing_roles": getattr(page, "editing_roles", None),
-        "last_edited_by": getattr(page, "last_edited_by", None),
-        "html_url": getattr(page, "html_url", None),
-        "todo_date": normalize_canvas_time(getattr(page, "todo_date", None)),
-        "created_at": normalize_canvas_time(getattr(page, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(page, "updated_at", None)),
+# Fields read from a page payload
+PAGE_FIELDS = (
+    "page_id",
+    "id",
+    "url",
+    "title",
+    "body",
+    "course_id",
+    "front_page",
+    "published",
+    "hide_from_students",
+    "editing_roles",
+    "last_edited_by",
+    "html_url",
+    "todo_date",
+    "created_at",
+    "updated_at",
+)
+
+
+def serialize_page(page: Any, include_body: bool = False) -> Dict[str, Any]:
+    """Serialize a Canvas Page to dict (the HTML body only if include_body)."""
+    get = raw_fields(page, PAGE_FIELDS).get
+    result = {
+        "id": get("page_id") or get("id"),
+        "url": get("url"),
+        "title": get("title"),
+        "course_id": get("course_id"),
+        "front_page": get("front_page", False),
+        "published": get("published"),
+        "hide_from_students": get("hide_from_students", False),
+        "editing_roles": get("editing_roles"),
+        "last_edited_by": get("last_edited_by"),
+        "html_url": get("html_url"),
+        "todo_date": normalize_canvas_time(get("todo_date")),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
     }
+    if include_body:
+        result["body"] = get("body")
+    return result
+
+
+# Fields read from a file payload
+FILE_FIELDS = (
+    "id",
+    "uuid",
+    "display_name",
+    "filename",
+    "folder_id",
+    "content_type",
+    "size",
+    "url",
+    "html_url",
+    "thumbnail_url",
+    "locked",
+    "locked_for_user",
+    "hidden",
+    "hidden_for_user",
+    "upload_status",
+    "created_at",
+    "updated_at",
+    "modified_at",
+)
 
 
 def serialize_file(file: Any) -> Dict[str, Any]:
     """Serialize a Canvas File to dict."""
+    get = raw_fields(file, FILE_FIELDS).get
     return {
-        "id": getattr(file, "id", None),
-        "uuid": getattr(file, "uuid", None),
-        "display_name": getattr(file, "display_name", None),
-        "filename": getattr(file, "filename", None),
-        "folder_id": getattr(file, "folder_id", None),
-        "content_type": getattr(file, "content_type", None),
-        "size": getattr(file, "size", None),
-        "url": getattr(file, "url", None),
-        "html_url": getattr(file, "html_url", None),
-        "thumbnail_url": getattr(file, "thumbnail_url", None),
-        "locked": getattr(file, "locked", False),
-        "locked_for_user": getattr(file, "locked_for_user", False),
-        "hidden": getattr(file, "hidden", False),
-        "hidden_for_user": getattr(file, "hidden_for_user", False),
-        "upload_status": getattr(file, "upload_status", None),
-        "created_at": normalize_canvas_time(getattr(file, "created_at", None)),
-        "updated_at": normalize_canvas_time(getattr(file, "updated_at", None)),
-        "modified_at": normalize_canvas_time(getattr(file, "modified_at", None)),
+        "id": get("id"),
+        "uuid": get("uuid"),
+        "display_name": get("display_name"),
+        "filename": get("filename"),
+        "folder_id": get("folder_id"),
+        "content_type": get("content_type"),
+        "size": get("size"),
+        "url": get("url"),
+        "html_url": get("html_url"),
+        "thumbnail_url": get("thumbnail_url"),
+        "locked": get("locked", False),
+        "locked_for_user": get("locked_for_user", False),
+        "hidden": get("hidden", False),
+        "hidden_for_user": get("hidden_for_user", False),
+        "upload_status": get("upload_status"),
+        "created_at": normalize_canvas_time(get("created_at")),
+        "updated_at": normalize_canvas_time(get("updated_at")),
+        "modified_at": normalize_canvas_time(get("modified_at")),
     }
 
 
@@ -118,57 +216,15 @@ def canvas_list_modules(
     Returns:
         Tool output with modules
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
-
-        paginated = course.get_modules()
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        modules = [serialize_module(module) for module in items]
-
-        return build_tool_output(
-            tool="canvas_list_modules",
-            items=modules,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_modules",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_modules",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    return run_list_tool(
+        "canvas_list_modules",
+        auth,
+        lambda client: client.get_course(course_id).get_modules(per_page=CANVAS_PER_PAGE),
+        serialize_module,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
 
 
 def canvas_list_module_items(
@@ -194,58 +250,64 @@ def canvas_list_module_items(
     Returns:
         Tool output with module items
     """
-    errors: List[str] = []
+    return run_list_tool(
+        "canvas_list_module_items",
+        auth,
+        lambda client: client.get_course(course_id)
+        .get_module(module_id)
+        .get_module_items(per_page=CANVAS_PER_PAGE),
+        serialize_module_item,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
+
+
+def _module_page_refs(course: Any, limit: Optional[int] = None) -> List[Tuple[str, Any]]:
+    """Collect (page_url, title) for Page items in a course's modules.
+
+    Modules are read lazily; with a limit, scanning stops once that many
+    pages are found, so later module pages are never requested.
+    """
+    page_refs: List[Tuple[str, Any]] = []
+    for module in course.get_modules(per_page=CANVAS_PER_PAGE):
+        if limit is not None and len(page_refs) >= limit:
+            break
+        try:
+            module_items = list(module.get_module_items(per_page=CANVAS_PER_PAGE))
+        except Exception:
+            continue
+        for item in module_items:
+            if getattr(item, 'type', None) == 'Page':
+                page_url = getattr(item, 'page_url', None)
+                if page_url:
+                    page_refs.append((page_url, getattr(item, 'title', None)))
+    return page_refs
 
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
 
-        module = course.get_module(module_id)
-        paginated = module.get_module_items()
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
+def _fetch_module_pages(
+    course: Any,
+    course_id: int,
+    page_refs: List[Tuple[str, Any]],
+    include_body: bool,
+) -> List[Dict[str, Any]]:
+    """Fetch and serialize pages concurrently, keeping page_refs order.
 
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
+    A page that can't be fetched is reported with just its url and title.
+    """
 
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
+    def fetch(ref: Tuple[str, Any]) -> Dict[str, Any]:
+        page_url, title = ref
+        try:
+            return serialize_page(course.get_page(page_url), include_body)
+        except Exception:
+            return {"url": page_url, "title": title, "course_id": course_id}
 
-        module_items = [serialize_module_item(item) for item in items]
-
-        return build_tool_output(
-            tool="canvas_list_module_items",
-            items=module_items,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_module_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_module_items",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    if not page_refs:
+        return []
+    max_workers = min(len(page_refs), MAX_CONCURRENT_REQUESTS)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fetch, page_refs))
 
 
 def canvas_list_pages(
@@ -255,6 +317,7 @@ def canvas_list_pages(
     page: int = 1,
     page_size: int = 100,
     since: Optional[str] = None,
+    include_body: bool = False,
 ) -> Dict[str, Any]:
     """
     List pages for a course.
@@ -269,6 +332,7 @@ def canvas_list_pages(
         page: Page number
         page_size: Items per page
         since: ISO timestamp for delta fetch
+        include_body: Include each page's HTML body
 
     Returns:
         Tool output with pages
@@ -277,48 +341,40 @@ def canvas_list_pages(
 
     try:
         auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
+        client = get_cached_client(auth_ctx)
         course = client.get_course(course_id)
 
-        all_pages = []
+        direct_pages: List[Any] = []
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
 
         # Try direct API first
+        kwargs: Dict[str, Any] = {}
+        if include_body:
+            kwargs["include"] = ["body"]
+
         try:
-            paginated = course.get_pages()
-            items, _ = CanvasClient.extract_paginated_list(paginated, 1, 1000)
-            all_pages = [serialize_page(p) for p in items]
+            paginated = course.get_pages(per_page=CANVAS_PER_PAGE, **kwargs)
+            direct_pages, _ = CanvasClient.extract_paginated_list(paginated, 1, 1000)
         except Exception:
             # Direct API failed, use fallback
             errors.append("Direct pages API unavailable, using module fallback")
 
-        # Fallback: Extract pages from modules if direct API failed
-        if not all_pages:
-            modules = list(course.get_modules())
-
-            for module in modules:
-                try:
-                    module_items = list(module.get_module_items())
-                    for item in module_items:
-                        if getattr(item, 'type', None) == 'Page':
-                            page_url = getattr(item, 'page_url', None)
-                            if page_url:
-                                try:
-                                    p = course.get_page(page_url)
-                                    all_pages.append(serialize_page(p))
-                                except Exception:
-                                    all_pages.append({
-                                        "url": page_url,
-                                        "title": getattr(item, 'title', None),
-                                        "course_id": course_id,
-                                    })
-                except Exception:
-                    continue
-
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_pages = all_pages[start_idx:end_idx]
-        has_more = len(all_pages) > end_idx
+        if direct_pages:
+            # Only the requested window needs serializing
+            paginated_pages = [
+                serialize_page(p, include_body) for p in direct_pages[start_idx:end_idx]
+            ]
+            has_more = len(direct_pages) > end_idx
+        else:
+            # Fallback: Extract pages from modules if direct API failed.
+            # Only the requested window is fetched (one extra ref tells us
+            # if there are more), with the page GETs issued concurrently.
+            page_refs = _module_page_refs(course, limit=end_idx + 1)
+            paginated_pages = _fetch_module_pages(
+                course, course_id, page_refs[start_idx:end_idx], include_body
+            )
+            has_more = len(page_refs) > end_idx
 
         return build_tool_output(
             tool="canvas_list_pages",
@@ -331,23 +387,13 @@ def canvas_list_pages(
 
     except CanvasException as e:
         errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_pages",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_pages", page=page, page_size=page_size, errors=errors
         )
     except Exception as e:
         errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_pages",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
+        return build_error_output(
+            tool="canvas_list_pages", page=page, page_size=page_size, errors=errors
         )
 
 
@@ -372,54 +418,12 @@ def canvas_list_files(
     Returns:
         Tool output with files
     """
-    errors: List[str] = []
-
-    try:
-        auth_ctx = resolve_auth(auth)
-        client = CanvasClient(auth_ctx)
-        course = client.get_course(course_id)
-
-        paginated = course.get_files()
-        items, has_more = CanvasClient.extract_paginated_list(paginated, page, page_size)
-
-        # Filter by since if provided
-        if since:
-            from ..utils.normalize_time import is_after
-
-            items = [
-                item
-                for item in items
-                if is_after(getattr(item, "updated_at", None), since)
-            ]
-
-        files = [serialize_file(f) for f in items]
-
-        return build_tool_output(
-            tool="canvas_list_files",
-            items=files,
-            page=page,
-            page_size=page_size,
-            has_more=has_more,
-            errors=errors,
-        )
-
-    except CanvasException as e:
-        errors.append(f"Canvas API error: {e}")
-        return build_tool_output(
-            tool="canvas_list_files",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
-    except Exception as e:
-        errors.append(f"Unexpected error: {e}")
-        return build_tool_output(
-            tool="canvas_list_files",
-            items=[],
-            page=page,
-            page_size=page_size,
-            has_more=False,
-            errors=errors,
-        )
+    return run_list_tool(
+        "canvas_list_files",
+        auth,
+        lambda client: client.get_course(course_id).get_files(per_page=CANVAS_PER_PAGE),
+        serialize_file,
+        page=page,
+        page_size=page_size,
+        since=since,
+    )
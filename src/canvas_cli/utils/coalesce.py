@@ -0,0 +1,66 @@
+"""In-flight request coalescing for identical concurrent tool calls."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _call_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Build a stable key for a call from its name and arguments."""
+    payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return f"{name}:{digest}"
+
+
+def coalesce(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator that shares one execution between identical concurrent calls.
+
+    While a call is running, any other call with the same arguments waits
+    for it and receives the same result instead of hitting Canvas again.
+    Nothing is cached once the call completes.
+
+    Args:
+        func: Function to wrap
+
+    Returns:
+        Decorated function
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = _call_key(func.__name__, args, kwargs)
+
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                _inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    return wrapper
@@ -0,0 +1,72 @@
+"""Short-lived cache of each user's active course IDs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from ..canvas_client import CANVAS_PER_PAGE, CLIENT_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from ..canvas_client import CanvasClient
+
+# Seconds an active-course list is reused before asking Canvas again
+ACTIVE_COURSES_TTL = 60.0
+
+# Least recently used first; capped like the client cache so a server
+# seeing many tokens doesn't keep every one of them around
+_active_courses: OrderedDict[tuple[str, str], tuple[float, list[int]]] = OrderedDict()
+_active_courses_lock = threading.Lock()
+
+
+def get_active_course_ids(client: CanvasClient) -> list[int]:
+    """
+    Get the IDs of the current user's active courses.
+
+    The result is cached per credential pair for ACTIVE_COURSES_TTL
+    seconds, so repeated calls within a session skip the user and
+    course list round-trips. At most CLIENT_CACHE_SIZE pairs are kept,
+    and expired entries are dropped whenever a new list is stored.
+
+    Args:
+        client: Canvas client for the user
+
+    Returns:
+        List of active course IDs
+    """
+    key = (client.base_url, client.access_token)
+    now = time.monotonic()
+
+    with _active_courses_lock:
+        entry = _active_courses.get(key)
+        if entry is not None:
+            _active_courses.move_to_end(key)
+    if entry is not None and now - entry[0] < ACTIVE_COURSES_TTL:
+        return list(entry[1])
+
+    user = client.get_current_user()
+    course_ids = [
+        c.id
+        for c in user.get_courses(enrollment_state=["active"], per_page=CANVAS_PER_PAGE)
+    ]
+
+    with _active_courses_lock:
+        expired = [
+            k for k, (fetched, _) in _active_courses.items()
+            if now - fetched >= ACTIVE_COURSES_TTL
+        ]
+        for stale_key in expired:
+            del _active_courses[stale_key]
+        _active_courses[key] = (now, course_ids)
+        _active_courses.move_to_end(key)
+        while len(_active_courses) > CLIENT_CACHE_SIZE:
+            _active_courses.popitem(last=False)
+    return list(course_ids)
+
+
+def clear_active_course_ids() -> None:
+    """Drop all cached active-course lists."""
+    with _active_courses_lock:
+        _active_courses.clear()
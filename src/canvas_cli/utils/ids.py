@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
+# Patterns compiled once at import rather than looked up per call
+_CONTEXT_CODE_RE = re.compile(r"^(course|user|group|account|section)_(\d+)$")
+_DIGITS_RE = re.compile(r"\d+")
 
+
+@functools.lru_cache(maxsize=1024)
 def parse_context_code(context_code: str) -> tuple[str, int] | None:
     """
     Parse a Canvas context code into type and ID.
@@ -15,6 +21,8 @@ def parse_context_code(context_code: str) -> tuple[str, int] | None:
     - "user_456"
     - "group_789"
 
+    Results are memoized; a user only has a handful of distinct codes.
+
     Args:
         context_code: Canvas context code string
 
@@ -24,7 +32,7 @@ def parse_context_code(context_code: str) -> tuple[str, int] | None:
     if not context_code:
         return None
 
-    match = re.match(r"^(course|user|group|account|section)_(\d+)$", context_code)
+    match = _CONTEXT_CODE_RE.match(context_code)
     if match:
         return match.group(1), int(match.group(2))
 
@@ -61,6 +69,10 @@ def extract_id(value: Any) -> int | None:
     Returns:
         Integer ID or None
     """
+    # Plain ints are by far the most common input
+    if type(value) is int:
+        return value
+
     if value is None:
         return None
 
@@ -72,7 +84,7 @@ def extract_id(value: Any) -> int | None:
             return int(value)
         except ValueError:
             # Try to extract digits from the string
-            match = re.search(r"\d+", value)
+            match = _DIGITS_RE.search(value)
             if match:
                 return int(match.group())
             return None
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
+
+# (epoch second, formatted string) of the last now_iso() call
+_now_iso_cache: tuple[int, str] = (-1, "")
 
 
 def to_iso(dt: datetime | str | None) -> str | None:
@@ -47,6 +52,19 @@ def from_iso(iso_str: str | None) -> datetime | None:
     if not iso_str:
         return None
 
+    # Fast path: fromisoformat is implemented in C and covers what Canvas
+    # sends; "Z" is rewritten because Python 3.10 doesn't accept it
+    try:
+        dt = datetime.fromisoformat(
+            iso_str[:-1] + "+00:00" if iso_str.endswith("Z") else iso_str
+        )
+    except ValueError:
+        pass
+    else:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+
     # Common ISO formats to try
     formats = [
         "%Y-%m-%dT%H:%M:%SZ",
@@ -76,10 +94,20 @@ def now_iso() -> str:
     """
     Get current time as ISO 8601 string.
 
+    The string only has second precision, so it is formatted once per
+    wall-clock second and reused for every call within that second.
+
     Returns:
         Current time in ISO 8601 format with Z suffix
     """
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+    global _now_iso_cache
+
+    second = int(time.time())
+    cached_second, cached = _now_iso_cache
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+        _now_iso_cache = (second, cached)
+    return cached
 
 
 def is_after(dt: datetime | str | None, since: str | None) -> bool:
@@ -96,14 +124,29 @@ def is_after(dt: datetime | str | None, since: str | None) -> bool:
     if since is None:
         return True
 
+    return is_after_dt(dt, from_iso(since))
+
+
+def is_after_dt(dt: datetime | str | None, since_dt: datetime | None) -> bool:
+    """
+    Check if a datetime is after an already-parsed timestamp.
+
+    Use this in filters so ``since`` is parsed once rather than per item.
+
+    Args:
+        dt: Datetime or ISO string to check
+        since_dt: Parsed timestamp to compare against (None matches any dt)
+
+    Returns:
+        True if dt is after since_dt, False otherwise
+    """
     if dt is None:
         return False
 
-    since_dt = from_iso(since)
     if since_dt is None:
         return True
 
-    check_dt = from_iso(to_iso(dt)) if isinstance(dt, str) else dt
+    check_dt = from_iso(_normalize_time_str(dt)) if isinstance(dt, str) else dt
     if check_dt is None:
         return False
 
@@ -116,6 +159,38 @@ def is_after(dt: datetime | str | None, since: str | None) -> bool:
     return check_dt > since_dt
 
 
+def filter_since(items: Iterable[Any], since: str, field: str = "updated_at") -> list[Any]:
+    """
+    Keep the items whose timestamp field is after ``since``.
+
+    ``since`` is parsed once for the whole list. Items may be raw JSON
+    dicts or objects (read with getattr).
+
+    Args:
+        items: Items to filter
+        since: ISO string to compare against
+        field: Name of the timestamp field on each item
+
+    Returns:
+        Items with ``field`` after ``since``, in their original order
+    """
+    since_dt = from_iso(since)
+    return [
+        item
+        for item in items
+        if is_after_dt(
+            item.get(field) if isinstance(item, dict) else getattr(item, field, None),
+            since_dt,
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_time_str(value: str) -> str | None:
+    """Normalize a Canvas time string (memoized; timestamps repeat a lot)."""
+    return to_iso(value)
+
+
 def normalize_canvas_time(value: Any) -> str | None:
     """
     Normalize Canvas API time values to ISO string.
@@ -131,10 +206,10 @@ def normalize_canvas_time(value: Any) -> str | None:
     if value is None:
         return None
 
-    if isinstance(value, datetime):
-        return to_iso(value)
-
     if isinstance(value, str):
+        return _normalize_time_str(value)
+
+    if isinstance(value, datetime):
         return to_iso(value)
 
     return None
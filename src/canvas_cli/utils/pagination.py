@@ -75,6 +75,35 @@ def build_tool_output(
     }
 
 
+def build_error_output(
+    *,
+    tool: str,
+    page: int,
+    page_size: int,
+    errors: list[str],
+) -> dict[str, Any]:
+    """
+    Build the empty tool output returned when a tool call fails.
+
+    Args:
+        tool: Name of the tool
+        page: Requested page number
+        page_size: Requested items per page
+        errors: Error messages, including the failure itself
+
+    Returns:
+        Tool output with no items and no further pages
+    """
+    return build_tool_output(
+        tool=tool,
+        items=[],
+        page=page,
+        page_size=page_size,
+        has_more=False,
+        errors=errors,
+    )
+
+
 def slice_items(
     items: list[Any],
     page: int,
@@ -0,0 +1,115 @@
+"""Rate limiting for Canvas API requests based on response headers."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from requests.models import PreparedRequest, Response
+
+# Canvas reports its remaining request quota in this header (a float)
+RATE_LIMIT_HEADER = "X-Rate-Limit-Remaining"
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that tracks Canvas's remaining request quota.
+
+    Caps the number of in-flight requests and, once the quota reported by
+    Canvas drops below ``low_water``, delays new requests proportionally so
+    the bucket has time to refill.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 16,
+        low_water: float = 100.0,
+        max_delay: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            max_concurrent: Maximum number of requests in flight at once
+            low_water: Remaining quota below which requests are delayed
+            max_delay: Delay (seconds) applied when the quota is exhausted
+        """
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._low_water = low_water
+        self._max_delay = max_delay
+        self.remaining: float | None = None
+
+    def __enter__(self) -> RateLimiter:
+        self._semaphore.acquire()
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+    def delay(self) -> float:
+        """Get how long to wait before the next request (seconds)."""
+        remaining = self.remaining
+        if remaining is None or remaining >= self._low_water:
+            return 0.0
+        return self._max_delay * (1 - max(remaining, 0.0) / self._low_water)
+
+    def update(self, response: Response) -> None:
+        """Record the remaining quota reported by a Canvas response."""
+        value = response.headers.get(RATE_LIMIT_HEADER)
+        if value is None:
+            return
+        try:
+            remaining = float(value)
+        except ValueError:
+            return
+        with self._lock:
+            self.remaining = remaining
+
+
+def is_rate_limited(response: Response) -> bool:
+    """Check whether a response is a Canvas rate-limit rejection."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and "Rate Limit Exceeded" in response.text
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that routes requests through a RateLimiter and retries throttled ones."""
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        rate_limit_retries: int = 5,
+        backoff_base: float = 1.0,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            limiter: Shared limiter for all requests sent through this adapter
+            rate_limit_retries: Maximum retries for rate-limited responses
+            backoff_base: Base time for exponential backoff (seconds)
+            **kwargs: Passed through to HTTPAdapter (pool sizing, etc.)
+        """
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.rate_limit_retries = rate_limit_retries
+        self.backoff_base = backoff_base
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        for attempt in range(self.rate_limit_retries + 1):
+            with self.limiter:
+                response = super().send(request, *args, **kwargs)
+            self.limiter.update(response)
+
+            if not is_rate_limited(response) or attempt == self.rate_limit_retries:
+                return response
+
+            response.close()
+            time.sleep(self.backoff_base * (2**attempt) + random.random())
+
+        return response
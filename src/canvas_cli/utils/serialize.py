@@ -0,0 +1,46 @@
+"""Helpers for reading fields off Canvas API objects."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from canvasapi.canvas_object import CanvasObject
+
+
+def raw_fields(obj: Any, fields: Iterable[str]) -> dict[str, Any]:
+    """
+    Get the raw JSON fields of a Canvas object as a dict.
+
+    canvasapi stores the API payload as instance attributes, so its
+    ``__dict__`` is the raw dict and can be read with plain ``dict.get``
+    instead of one getattr per field. Raw dicts are returned as-is and
+    other objects fall back to getattr for the given fields.
+
+    Args:
+        obj: canvasapi object, raw JSON dict, or any attribute-bearing object
+        fields: Field names to read when falling back to getattr
+
+    Returns:
+        Dict of field name to value (missing fields are absent)
+    """
+    if isinstance(obj, dict):
+        return obj
+    if isinstance(obj, CanvasObject):
+        return obj.__dict__
+    return {name: getattr(obj, name) for name in fields if hasattr(obj, name)}
+
+
+def truncate_text(text: Any, max_chars: int | None) -> Any:
+    """
+    Cap a long text field (e.g. an HTML description) at max_chars.
+
+    Args:
+        text: Field value; non-strings are returned unchanged
+        max_chars: Maximum length to keep, or None for no limit
+
+    Returns:
+        The text, cut to max_chars with a trailing "…" if it was longer
+    """
+    if max_chars is None or not isinstance(text, str) or len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "…"
@@ -0,0 +1,40 @@
+"""Tests for tool auth resolution."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from canvas_cli.models import AuthContext
+from canvas_cli.tools.auth import resolve_auth
+
+
+class TestResolveAuth:
+    """Tests for resolve_auth function."""
+
+    def test_auth_context_passthrough(self):
+        """Test that an AuthContext is returned unchanged."""
+        auth = AuthContext(
+            canvas_base_url="https://canvas.example.com/api/v1",
+            canvas_access_token="test_token_123",
+        )
+        assert resolve_auth(auth) is auth
+
+    def test_dict_reuses_context(self):
+        """Test that the same credentials resolve to one shared AuthContext."""
+        first = resolve_auth({
+            "canvas_base_url": "https://canvas.example.com/api/v1",
+            "canvas_access_token": "test_token_123",
+        })
+        second = resolve_auth({
+            "canvasApiUrl": "https://canvas.example.com/api/v1",
+            "canvasApiKey": "test_token_123",
+        })
+
+        assert first.canvas_access_token == "test_token_123"
+        assert second is first
+
+    def test_dict_missing_token_raises(self):
+        """Test that incomplete credentials still fail validation."""
+        with pytest.raises(ValidationError):
+            resolve_auth({"canvas_base_url": "https://canvas.example.com/api/v1"})
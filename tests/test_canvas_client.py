@@ -0,0 +1,48 @@
+"""Tests for the shared CanvasClient cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from canvas_cli import canvas_client
+from canvas_cli.canvas_client import get_cached_client
+from canvas_cli.models import AuthContext
+
+
+def _auth(token: str) -> AuthContext:
+    return AuthContext(
+        canvas_base_url="https://canvas.example.com/api/v1",
+        canvas_access_token=token,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    canvas_client._client_cache.clear()
+    yield
+    canvas_client._client_cache.clear()
+
+
+class TestGetCachedClient:
+    """Tests for get_cached_client function."""
+
+    def test_same_credentials_share_client(self):
+        """Test that repeated calls return the same client."""
+        assert get_cached_client(_auth("a")) is get_cached_client(_auth("a"))
+        assert get_cached_client(_auth("a")) is not get_cached_client(_auth("b"))
+
+    def test_evicted_client_is_closed(self, monkeypatch):
+        """Test that the least recently used client is closed on eviction."""
+        monkeypatch.setattr(canvas_client, "CLIENT_CACHE_SIZE", 2)
+        closed = []
+        monkeypatch.setattr(
+            canvas_client.CanvasClient, "close", lambda self: closed.append(self)
+        )
+
+        first = get_cached_client(_auth("a"))
+        second = get_cached_client(_auth("b"))
+        get_cached_client(_auth("a"))
+        get_cached_client(_auth("c"))
+
+        assert closed == [second]
+        assert get_cached_client(_auth("a")) is first
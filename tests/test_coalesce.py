@@ -0,0 +1,93 @@
+"""Tests for in-flight request coalescing."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from canvas_cli.utils import coalesce as coalesce_module
+from canvas_cli.utils.coalesce import coalesce
+
+
+class TestCoalesce:
+    """Tests for the coalesce decorator."""
+
+    def test_concurrent_identical_calls_share_result(self, monkeypatch):
+        """Test that identical concurrent calls run the function once."""
+        calls = []
+        waiting = []
+        waiting_changed = threading.Condition()
+        release = threading.Event()
+
+        class TrackingFuture(Future):
+            """Future that records callers blocked on its result."""
+
+            def result(self, timeout=None):
+                with waiting_changed:
+                    waiting.append(threading.current_thread())
+                    waiting_changed.notify_all()
+                return super().result(timeout)
+
+        monkeypatch.setattr(coalesce_module, "Future", TrackingFuture)
+
+        @coalesce
+        def slow(value):
+            calls.append(value)
+            assert release.wait(timeout=5)
+            return {"value": value}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow(1))) for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+
+        # Hold the owning call open until the other four are waiting on it
+        with waiting_changed:
+            assert waiting_changed.wait_for(lambda: len(waiting) == 4, timeout=5)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 1}] * 5
+
+    def test_different_arguments_not_coalesced(self):
+        """Test that calls with different arguments run separately."""
+        calls = []
+
+        @coalesce
+        def fn(value):
+            calls.append(value)
+            return value
+
+        assert fn(1) == 1
+        assert fn(2) == 2
+        assert calls == [1, 2]
+
+    def test_sequential_calls_not_cached(self):
+        """Test that completed calls are not reused."""
+        calls = []
+
+        @coalesce
+        def fn(value):
+            calls.append(value)
+            return value
+
+        fn(1)
+        fn(1)
+
+        assert calls == [1, 1]
+
+    def test_exception_propagates(self):
+        """Test that exceptions are raised to the caller."""
+
+        @coalesce
+        def fn():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fn()
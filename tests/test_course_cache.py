@@ -0,0 +1,97 @@
+"""Tests for the active-course ID cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from canvas_cli.utils import course_cache
+from canvas_cli.utils.course_cache import clear_active_course_ids, get_active_course_ids
+
+
+class MockCourse:
+    def __init__(self, course_id):
+        self.id = course_id
+
+
+class MockUser:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get_courses(self, **kwargs):
+        self.calls.append(kwargs)
+        return [MockCourse(1), MockCourse(2)]
+
+
+class MockClient:
+    def __init__(self, token="token"):
+        self.base_url = "https://canvas.example.com"
+        self.access_token = token
+        self.calls = []
+
+    def get_current_user(self):
+        return MockUser(self.calls)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_active_course_ids()
+    yield
+    clear_active_course_ids()
+
+
+class TestGetActiveCourseIds:
+    """Tests for get_active_course_ids function."""
+
+    def test_repeated_calls_use_cache(self):
+        """Test that a second call within the TTL skips Canvas."""
+        client = MockClient()
+
+        assert get_active_course_ids(client) == [1, 2]
+        assert get_active_course_ids(client) == [1, 2]
+        assert len(client.calls) == 1
+        assert client.calls[0]["enrollment_state"] == ["active"]
+
+    def test_cache_is_per_credential(self):
+        """Test that different tokens don't share cached IDs."""
+        first = MockClient("a")
+        second = MockClient("b")
+
+        get_active_course_ids(first)
+        get_active_course_ids(second)
+
+        assert len(first.calls) == 1
+        assert len(second.calls) == 1
+
+    def test_expired_entry_refetches(self, monkeypatch):
+        """Test that entries older than the TTL are refreshed."""
+        client = MockClient()
+        get_active_course_ids(client)
+
+        monkeypatch.setattr(course_cache, "ACTIVE_COURSES_TTL", 0.0)
+        get_active_course_ids(client)
+
+        assert len(client.calls) == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently used credentials are evicted."""
+        monkeypatch.setattr(course_cache, "CLIENT_CACHE_SIZE", 2)
+        first, second, third = MockClient("a"), MockClient("b"), MockClient("c")
+
+        get_active_course_ids(first)
+        get_active_course_ids(second)
+        get_active_course_ids(first)
+        get_active_course_ids(third)
+
+        assert list(course_cache._active_courses) == [
+            (first.base_url, "a"),
+            (third.base_url, "c"),
+        ]
+
+    def test_expired_entries_are_pruned(self, monkeypatch):
+        """Test that storing a new list drops expired entries."""
+        get_active_course_ids(MockClient("a"))
+
+        monkeypatch.setattr(course_cache, "ACTIVE_COURSES_TTL", 0.0)
+        get_active_course_ids(MockClient("b"))
+
+        assert list(course_cache._active_courses) == [("https://canvas.example.com", "b")]
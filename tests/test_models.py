@@ -39,6 +39,22 @@ class TestAuthContext:
         with pytest.raises(ValidationError):
             AuthContext(canvas_access_token="token")
 
+    def test_auth_context_is_frozen(self):
+        """Test that AuthContext is immutable and hashable."""
+        auth = AuthContext(
+            canvas_base_url="https://canvas.example.com/api/v1",
+            canvas_access_token="test_token_123",
+        )
+        with pytest.raises(ValidationError):
+            auth.canvas_access_token = "other"
+
+        same = AuthContext(
+            canvas_base_url="https://canvas.example.com/api/v1",
+            canvas_access_token="test_token_123",
+        )
+        assert hash(auth) == hash(same)
+        assert {auth, same} == {auth}
+
 
 class TestPaginationParams:
     """Tests for PaginationParams model."""
@@ -0,0 +1,118 @@
+"""Tests for time normalization utilities."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from canvas_cli.utils.normalize_time import (
+    filter_since,
+    from_iso,
+    is_after,
+    is_after_dt,
+    normalize_canvas_time,
+)
+
+
+class TestNormalizeCanvasTime:
+    """Tests for normalize_canvas_time function."""
+
+    def test_string(self):
+        """Test normalizing an ISO string."""
+        assert normalize_canvas_time("2024-01-15T10:00:00.123Z") == "2024-01-15T10:00:00Z"
+
+    def test_datetime(self):
+        """Test normalizing a datetime."""
+        dt = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        assert normalize_canvas_time(dt) == "2024-01-15T10:00:00Z"
+
+    def test_invalid_values(self):
+        """Test that unparseable or unsupported values return None."""
+        assert normalize_canvas_time(None) is None
+        assert normalize_canvas_time("not a date") is None
+        assert normalize_canvas_time(["2024-01-15"]) is None
+
+
+class TestIsAfter:
+    """Tests for is_after and is_after_dt functions."""
+
+    def test_is_after(self):
+        """Test comparing against an ISO string."""
+        assert is_after("2024-02-01T00:00:00Z", "2024-01-01T00:00:00Z") is True
+        assert is_after("2023-12-01T00:00:00Z", "2024-01-01T00:00:00Z") is False
+
+    def test_missing_values(self):
+        """Test None handling."""
+        assert is_after("2024-02-01T00:00:00Z", None) is True
+        assert is_after(None, "2024-01-01T00:00:00Z") is False
+
+    def test_is_after_dt_matches_is_after(self):
+        """Test that the pre-parsed variant gives the same answers."""
+        since = "2024-01-01T00:00:00Z"
+        since_dt = from_iso(since)
+        for value in ["2024-02-01T00:00:00Z", "2023-12-01T00:00:00Z", None, "garbage"]:
+            assert is_after_dt(value, since_dt) == is_after(value, since)
+
+    def test_is_after_dt_without_since(self):
+        """Test that an unparsed since matches any present value."""
+        assert is_after_dt("2024-02-01T00:00:00Z", None) is True
+        assert is_after_dt(None, None) is False
+
+
+class TestFromIso:
+    """Tests for from_iso function."""
+
+    def test_supported_formats(self):
+        """Test that each supported layout parses to the same UTC instant."""
+        expected = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        for value in [
+            "2024-01-15T10:00:00Z",
+            "2024-01-15T10:00:00+00:00",
+            "2024-01-15T10:00:00+0000",
+            "2024-01-15T10:00:00",
+            "2024-01-15 10:00:00",
+        ]:
+            assert from_iso(value) == expected
+
+    def test_fractional_seconds(self):
+        """Test fractional seconds of any precision."""
+        assert from_iso("2024-01-15T10:00:00.5Z").microsecond == 500000
+        assert from_iso("2024-01-15T10:00:00.123456Z").microsecond == 123456
+
+    def test_date_only(self):
+        """Test that a bare date is midnight UTC."""
+        assert from_iso("2024-01-15") == datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+    def test_invalid(self):
+        """Test that unparseable strings return None."""
+        assert from_iso("not a date") is None
+        assert from_iso("") is None
+
+
+class TestFilterSince:
+    """Tests for filter_since function."""
+
+    def test_filters_objects_and_dicts(self):
+        """Test that objects and raw dicts are both filtered in order."""
+        class Item:
+            def __init__(self, updated_at):
+                self.updated_at = updated_at
+
+        old = Item("2023-12-01T00:00:00Z")
+        new = Item("2024-02-01T00:00:00Z")
+        raw = {"updated_at": "2024-03-01T00:00:00Z"}
+        missing = {"id": 1}
+
+        result = filter_since([old, new, raw, missing], "2024-01-01T00:00:00Z")
+
+        assert result == [new, raw]
+
+    def test_custom_field(self):
+        """Test filtering on a field other than updated_at."""
+        messages = [
+            {"id": 1, "created_at": "2023-12-01T00:00:00Z"},
+            {"id": 2, "created_at": "2024-02-01T00:00:00Z"},
+        ]
+
+        result = filter_since(messages, "2024-01-01T00:00:00Z", "created_at")
+
+        assert [m["id"] for m in result] == [2]
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import pytest
 
+from canvas_cli.canvas_client import CanvasClient
 from canvas_cli.utils.pagination import (
+    build_error_output,
     build_pagination_result,
     build_tool_output,
     slice_items,
@@ -101,6 +103,25 @@ class TestBuildToolOutput:
         assert result["pagination"]["total_count"] == 100
 
 
+class TestBuildErrorOutput:
+    """Tests for build_error_output function."""
+
+    def test_error_output(self):
+        """Test that a failed call yields an empty, not-ok page."""
+        result = build_error_output(
+            tool="test_tool",
+            page=2,
+            page_size=10,
+            errors=["Canvas API error: boom"],
+        )
+
+        assert result["ok"] is False
+        assert result["tool"] == "test_tool"
+        assert result["items"] == []
+        assert result["pagination"] == {"page": 2, "page_size": 10, "next_page": None}
+        assert result["errors"] == ["Canvas API error: boom"]
+
+
 class TestSliceItems:
     """Tests for slice_items function."""
 
@@ -170,6 +191,43 @@ class TestSliceItems:
         assert has_more is True
 
 
+class TestExtractPaginatedList:
+    """Tests for CanvasClient.extract_paginated_list."""
+
+    def test_first_page(self):
+        """Test extracting the first page."""
+        items, has_more = CanvasClient.extract_paginated_list(iter(range(1, 101)), 1, 10)
+
+        assert items == list(range(1, 11))
+        assert has_more is True
+
+    def test_last_page(self):
+        """Test extracting the last full page."""
+        items, has_more = CanvasClient.extract_paginated_list(iter(range(1, 101)), 10, 10)
+
+        assert items == list(range(91, 101))
+        assert has_more is False
+
+    def test_only_consumes_needed_items(self):
+        """Test that iteration stops after page_size + 1 items of the window."""
+        source = iter(range(1, 101))
+        CanvasClient.extract_paginated_list(source, 2, 10)
+
+        assert next(source) == 22
+
+    def test_failing_iterator(self):
+        """Test that iteration errors return an empty page."""
+
+        def broken():
+            yield 1
+            raise RuntimeError("boom")
+
+        items, has_more = CanvasClient.extract_paginated_list(broken(), 1, 10)
+
+        assert items == []
+        assert has_more is False
+
+
 @pytest.mark.integration
 class TestRealPagination:
     """Integration tests for pagination with real Canvas data."""
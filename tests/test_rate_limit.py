@@ -0,0 +1,100 @@
+"""Tests for Canvas rate limiting utilities."""
+
+from __future__ import annotations
+
+import io
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from canvas_cli.utils.rate_limit import (
+    RateLimitedAdapter,
+    RateLimiter,
+    is_rate_limited,
+)
+
+
+def make_response(status_code: int = 200, text: str = "", remaining: str | None = None):
+    """Build a requests.Response for tests."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode()
+    response.raw = io.BytesIO()
+    if remaining is not None:
+        response.headers["X-Rate-Limit-Remaining"] = remaining
+    return response
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_no_delay_without_quota_info(self):
+        """Test that requests aren't delayed before any response is seen."""
+        limiter = RateLimiter()
+        assert limiter.delay() == 0.0
+
+    def test_update_from_header(self):
+        """Test reading the remaining quota from a response."""
+        limiter = RateLimiter()
+        limiter.update(make_response(remaining="650.5"))
+        assert limiter.remaining == 650.5
+        assert limiter.delay() == 0.0
+
+    def test_delay_when_quota_low(self):
+        """Test that delay grows as the quota drops below the low-water mark."""
+        limiter = RateLimiter(low_water=100.0, max_delay=1.0)
+        limiter.update(make_response(remaining="50"))
+        assert limiter.delay() == 0.5
+
+        limiter.update(make_response(remaining="0"))
+        assert limiter.delay() == 1.0
+
+    def test_ignores_invalid_header(self):
+        """Test that malformed headers are ignored."""
+        limiter = RateLimiter()
+        limiter.update(make_response(remaining="abc"))
+        assert limiter.remaining is None
+
+
+class TestIsRateLimited:
+    """Tests for is_rate_limited."""
+
+    def test_rate_limit_responses(self):
+        """Test detecting Canvas throttling responses."""
+        assert is_rate_limited(make_response(429))
+        assert is_rate_limited(make_response(403, "403 Forbidden (Rate Limit Exceeded)"))
+
+    def test_other_responses(self):
+        """Test that other responses are not treated as throttled."""
+        assert not is_rate_limited(make_response(200))
+        assert not is_rate_limited(make_response(403, "Forbidden"))
+
+
+class TestRateLimitedAdapter:
+    """Tests for RateLimitedAdapter."""
+
+    def test_retries_throttled_requests(self):
+        """Test that rate-limited responses are retried."""
+        responses = [make_response(429), make_response(200, remaining="700")]
+        adapter = RateLimitedAdapter(RateLimiter(), backoff_base=0)
+
+        with mock.patch.object(HTTPAdapter, "send", side_effect=responses) as send, \
+                mock.patch("canvas_cli.utils.rate_limit.time.sleep"):
+            response = adapter.send(mock.Mock())
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert adapter.limiter.remaining == 700.0
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last throttled response is returned."""
+        adapter = RateLimitedAdapter(RateLimiter(), rate_limit_retries=2, backoff_base=0)
+
+        with mock.patch.object(
+            HTTPAdapter, "send", side_effect=lambda *a, **k: make_response(429)
+        ) as send, mock.patch("canvas_cli.utils.rate_limit.time.sleep"):
+            response = adapter.send(mock.Mock())
+
+        assert response.status_code == 429
+        assert send.call_count == 3
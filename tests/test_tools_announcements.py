@@ -137,3 +137,17 @@ class TestSerializeAnnouncement:
 
         assert result["author"]["id"] is None
         assert result["author"]["display_name"] is None
+
+    def test_serialize_announcement_from_dict(self):
+        """Test serializing announcement from a raw JSON dict."""
+        result = serialize_announcement({
+            "id": 123,
+            "title": "Test",
+            "posted_at": "2024-01-15T10:00:00Z",
+            "author": {"id": 1, "display_name": "Instructor"},
+        })
+
+        assert result["id"] == 123
+        assert result["posted_at"] == "2024-01-15T10:00:00Z"
+        assert result["author"]["display_name"] == "Instructor"
+        assert result["unread_count"] == 0
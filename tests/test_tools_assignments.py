@@ -131,6 +131,33 @@ class TestSerializeAssignment:
         assert result["points_possible"] == 100
         assert result["course_id"] == 456
 
+    def test_serialize_assignment_from_canvas_object(self):
+        """Test serializing a canvasapi Assignment with a submission dict."""
+        from canvasapi.assignment import Assignment
+
+        assignment = Assignment(None, {
+            "id": 123,
+            "name": "Test Assignment",
+            "due_at": "2024-02-01T23:59:59.123Z",
+            "submission": {"id": 9, "score": 10, "submitted_at": "2024-01-31T10:00:00Z"},
+        })
+
+        result = serialize_assignment(assignment)
+
+        assert result["id"] == 123
+        assert result["due_at"] == "2024-02-01T23:59:59Z"
+        assert result["submission_types"] == []
+        assert result["submission"]["score"] == 10
+        assert result["submission"]["late"] is False
+
+    def test_serialize_assignment_truncates_description(self):
+        """Test that description_max_chars caps long descriptions."""
+        assignment = {"id": 1, "description": "x" * 100}
+
+        assert serialize_assignment(assignment)["description"] == "x" * 100
+        assert serialize_assignment(assignment, 10)["description"] == "x" * 10 + "…"
+        assert serialize_assignment({"id": 1}, 10)["description"] is None
+
 
 class TestSerializeQuiz:
     """Unit tests for serialize_quiz function."""
@@ -118,3 +118,22 @@ class TestSerializeCourse:
 
         assert len(result["enrollments"]) == 1
         assert result["enrollments"][0]["type"] == "StudentEnrollment"
+
+    def test_serialize_course_from_canvas_object(self):
+        """Test serializing a canvasapi Course whose enrollments are raw dicts."""
+        from canvasapi.course import Course
+
+        course = Course(None, {
+            "id": 123,
+            "name": "Test Course",
+            "start_at": "2024-01-15T00:00:00.000Z",
+            "enrollments": [{"type": "student", "role": "StudentEnrollment", "enrollment_state": "active"}],
+        })
+
+        result = serialize_course(course)
+
+        assert result["id"] == 123
+        assert result["start_at"] == "2024-01-15T00:00:00Z"
+        assert result["enrollments"] == [
+            {"type": "student", "role": "StudentEnrollment", "enrollment_state": "active"}
+        ]
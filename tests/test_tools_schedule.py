@@ -10,6 +10,8 @@ from canvas_cli.tools.schedule import (
     canvas_get_upcoming_events,
     canvas_get_calendar_events,
     canvas_get_planner_items,
+    serialize_todo,
+    serialize_upcoming_event,
 )
 
 
@@ -114,3 +116,59 @@ class TestScheduleToolErrors:
 
         assert result["ok"] is False
         assert len(result["errors"]) > 0
+
+
+class TestSerializeUpcomingEvent:
+    """Unit tests for serialize_upcoming_event function."""
+
+    def test_serialize_raw_dict_event(self):
+        """Test serializing an upcoming event returned as a raw dict."""
+        event = {
+            "id": 5,
+            "title": "Midterm",
+            "type": "event",
+            "start_at": "2024-03-01T10:00:00Z",
+            "end_at": "2024-03-01T12:00:00Z",
+        }
+
+        result = serialize_upcoming_event(event)
+
+        assert result["id"] == 5
+        assert result["title"] == "Midterm"
+        assert result["start_at"] == "2024-03-01T10:00:00Z"
+        assert result["end_at"] == "2024-03-01T12:00:00Z"
+        assert "due_at" not in result
+
+    def test_serialize_assignment_event_uses_name(self):
+        """Test that assignment events fall back to name for the title."""
+        event = {"id": 7, "name": "Essay", "due_at": None, "course_id": 3}
+
+        result = serialize_upcoming_event(event)
+
+        assert result["title"] == "Essay"
+        assert result["due_at"] is None
+        assert result["course_id"] == 3
+        assert "start_at" not in result
+
+
+class TestSerializeTodo:
+    """Unit tests for serialize_todo function."""
+
+    def test_serialize_todo_assignment_name(self):
+        """Test that the todo name comes from its assignment."""
+        class MockTodo:
+            type = "submitting"
+            course_id = 3
+            assignment = {"id": 9, "name": "Lab 1"}
+
+        result = serialize_todo(MockTodo())
+
+        assert result["name"] == "Lab 1"
+        assert result["course_id"] == 3
+
+    def test_serialize_todo_without_assignment(self):
+        """Test that a todo without an assignment has no name."""
+        class MockTodo:
+            type = "grading"
+
+        assert serialize_todo(MockTodo())["name"] is None
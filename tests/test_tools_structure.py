@@ -10,6 +10,7 @@ from canvas_cli.tools.structure import (
     canvas_list_module_items,
     canvas_list_pages,
     canvas_list_files,
+    _fetch_module_pages,
     serialize_module,
     serialize_module_item,
     serialize_page,
@@ -220,6 +221,15 @@ class TestSerializePage:
         assert result["id"] == 123
         assert result["title"] == "Page Title"
         assert result["url"] == "page-slug"
+        assert "body" not in result
+
+    def test_serialize_page_include_body(self):
+        """Test that the HTML body is only included on request."""
+        page = {"page_id": 123, "url": "page-slug", "body": "<p>Content</p>"}
+
+        result = serialize_page(page, include_body=True)
+
+        assert result["body"] == "<p>Content</p>"
 
 
 class TestSerializeFile:
@@ -245,3 +255,54 @@ class TestSerializeFile:
         assert result["display_name"] == "document.pdf"
         assert result["content_type"] == "application/pdf"
         assert result["size"] == 1024
+
+
+class TestFetchModulePages:
+    """Unit tests for the canvas_list_pages module fallback."""
+
+    class MockPage:
+        page_id = 123
+        url = "page-slug"
+        title = "Page Title"
+        body = "<p>Content</p>"
+        course_id = 456
+        published = True
+        updated_at = "2024-01-15T10:30:00Z"
+
+    class MockCourse:
+        def get_page(self, url):
+            if url == "missing":
+                raise Exception("not found")
+            return TestFetchModulePages.MockPage()
+
+    def test_fallback_pages_match_direct_shape(self):
+        """Test that fetched pages are fully serialized, without the body."""
+        result = _fetch_module_pages(
+            self.MockCourse(), 456, [("page-slug", "Page Title")], include_body=False
+        )
+
+        assert result == [serialize_page(self.MockPage())]
+        assert result[0]["id"] == 123
+        assert result[0]["published"] is True
+        assert result[0]["updated_at"] == "2024-01-15T10:30:00Z"
+        assert "body" not in result[0]
+
+    def test_fallback_pages_include_body(self):
+        """Test that the body is kept when requested."""
+        result = _fetch_module_pages(
+            self.MockCourse(), 456, [("page-slug", "Page Title")], include_body=True
+        )
+
+        assert result[0]["body"] == "<p>Content</p>"
+
+    def test_fallback_unfetchable_page_keeps_order(self):
+        """Test that a page that can't be fetched is reported by url and title."""
+        result = _fetch_module_pages(
+            self.MockCourse(),
+            456,
+            [("missing", "Gone"), ("page-slug", "Page Title")],
+            include_body=False,
+        )
+
+        assert result[0] == {"url": "missing", "title": "Gone", "course_id": 456}
+        assert result[1]["id"] == 123